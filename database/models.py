@@ -1,7 +1,8 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, JSON, Boolean
+from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, JSON, Boolean, inspect, text, literal_column
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
+from functools import lru_cache
 import os
 
 Base = declarative_base()
@@ -28,6 +29,19 @@ class Scholarship(Base):
     last_updated = Column(DateTime, default=datetime.utcnow)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+# Generated full-text search vector over the searchable scholarship text (PostgreSQL only, so not mapped on the model)
+SCHOLARSHIP_SEARCH_VECTOR = literal_column('scholarships.search_vec')
+SCHOLARSHIP_SEARCH_VECTOR_DDL = (
+    "ALTER TABLE scholarships ADD COLUMN search_vec tsvector GENERATED ALWAYS AS (to_tsvector('english', "
+    "coalesce(title, '') || ' ' || coalesce(category, '') || ' ' || coalesce(description, '') || ' ' || "
+    "coalesce(eligibility_criteria, ''))) STORED"
+)
+SCHOLARSHIP_SEARCH_INDEX_DDL = "CREATE INDEX scholarships_fts_idx ON scholarships USING GIN (search_vec)"
+# Expression index for the jsonb ?| / ?& demographic lookups (the column itself is plain JSON)
+SCHOLARSHIP_DEMOGRAPHICS_INDEX_DDL = (
+    "CREATE INDEX scholarships_demographics_idx ON scholarships USING GIN ((target_demographics::jsonb))"
+)
+
 class UserProfile(Base):
     __tablename__ = 'user_profiles'
     
@@ -94,18 +108,38 @@ def create_database_engine():
     if not database_url:
         raise ValueError("DATABASE_URL environment variable not set")
     
-    engine = create_engine(database_url, echo=False)
-    return engine
+    return _engine_for_url(database_url)
+
+@lru_cache(maxsize=None)
+def _engine_for_url(database_url):
+    """One engine, and so one connection pool, per database URL for the whole process"""
+    return create_engine(database_url, echo=False)
+
+@lru_cache(maxsize=None)
+def _session_factory(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def get_session():
-    engine = create_database_engine()
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    return SessionLocal()
+    return _session_factory(create_database_engine())()
 
 def create_tables():
     """Create all database tables"""
     engine = create_database_engine()
     Base.metadata.create_all(bind=engine)
+    if engine.dialect.name == 'postgresql':
+        _ensure_search_indexes(engine)
+
+def _ensure_search_indexes(engine):
+    """Add the scholarship full-text search column and the GIN search indexes if they are missing"""
+    inspector = inspect(engine)
+    index_names = {index['name'] for index in inspector.get_indexes('scholarships')}
+    with engine.begin() as connection:
+        if 'search_vec' not in {column['name'] for column in inspector.get_columns('scholarships')}:
+            connection.execute(text(SCHOLARSHIP_SEARCH_VECTOR_DDL))
+        if 'scholarships_fts_idx' not in index_names:
+            connection.execute(text(SCHOLARSHIP_SEARCH_INDEX_DDL))
+        if 'scholarships_demographics_idx' not in index_names:
+            connection.execute(text(SCHOLARSHIP_DEMOGRAPHICS_INDEX_DDL))
 
 def drop_tables():
     """Drop all database tables (use with caution)"""
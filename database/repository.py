@@ -1,15 +1,19 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
-from database.models import Scholarship, UserProfile, Application, SavedScholarship, SearchHistory, get_session
-from typing import List, Dict, Any, Optional
+from sqlalchemy import and_, or_, func, text, cast, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, array
+from database.models import Scholarship, UserProfile, Application, SavedScholarship, SearchHistory, get_session, SCHOLARSHIP_SEARCH_VECTOR
+from typing import List, Dict, Any, Optional, Tuple, Sequence, Iterator
 import pandas as pd
 from datetime import datetime
+import csv
+import io
+import json
 
 class ScholarshipRepository:
     """Repository for scholarship database operations"""
     
-    def __init__(self):
-        self.session = get_session()
+    def __init__(self, session: Optional[Session] = None):
+        self.session = session if session is not None else get_session()
     
     def close(self):
         """Close database session"""
@@ -38,6 +42,59 @@ class ScholarshipRepository:
             self.session.rollback()
             raise e
     
+    def copy_bulk(self, scholarships_data: List[Dict[str, Any]], rebuild_indexes: bool = False) -> int:
+        """Bulk load scholarships with PostgreSQL COPY (ORM bulk insert on other databases)"""
+        if self.session.get_bind().dialect.name != 'postgresql':
+            return len(self.bulk_create_scholarships(scholarships_data))
+        
+        columns = [column for column in Scholarship.__table__.columns if not column.primary_key]
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for data in scholarships_data:
+            row = []
+            for column in columns:
+                value = data.get(column.name)
+                if value is None and column.name not in data and column.default is not None:
+                    value = column.default.arg(None) if column.default.is_callable else column.default.arg
+                if value is None:
+                    value = '\\N'
+                elif isinstance(value, (list, dict)):
+                    value = json.dumps(value)
+                elif isinstance(value, datetime):
+                    value = value.isoformat()
+                row.append(value)
+            writer.writerow(row)
+        buf.seek(0)
+        
+        try:
+            indexes = []
+            if rebuild_indexes:
+                # Dropping secondary indexes first makes the load a single pass; they are rebuilt afterwards
+                # Only this schema's table: another schema on the search path may have its own scholarships
+                indexes = self.session.execute(text(
+                    "SELECT schemaname, indexname, indexdef FROM pg_indexes "
+                    "WHERE tablename = 'scholarships' AND schemaname = current_schema() "
+                    "AND NOT EXISTS (SELECT 1 FROM pg_constraint JOIN pg_namespace ON pg_namespace.oid = connamespace "
+                    "WHERE conname = indexname AND nspname = schemaname)"
+                )).all()
+                for schema_name, index_name, _ in indexes:
+                    self.session.execute(text(f'DROP INDEX "{schema_name}"."{index_name}"'))
+            
+            cursor = self.session.connection().connection.cursor()
+            try:
+                column_list = ', '.join(column.name for column in columns)
+                cursor.copy_expert(f"COPY scholarships ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buf)
+            finally:
+                cursor.close()
+            
+            for _, _, index_definition in indexes:
+                self.session.execute(text(index_definition))
+            self.session.commit()
+            return len(scholarships_data)
+        except Exception as e:
+            self.session.rollback()
+            raise e
+    
     def get_scholarship_by_id(self, scholarship_id: int) -> Optional[Scholarship]:
         """Get scholarship by ID"""
         try:
@@ -46,10 +103,51 @@ class ScholarshipRepository:
             self.session.rollback()
             raise e
     
-    def get_all_scholarships(self) -> List[Scholarship]:
-        """Get all scholarships"""
+    def get_all_scholarships(self, columns: Optional[Sequence[str]] = None) -> List[Scholarship]:
+        """Get all scholarships (as plain row tuples of just these columns, if given)"""
+        try:
+            return self._scholarship_query(columns).all()
+        except Exception as e:
+            self.session.rollback()
+            raise e
+    
+    def iter_scholarships(self, columns: Optional[Sequence[str]] = None, batch_size: int = 1000) -> Iterator[List[Any]]:
+        """Stream all scholarships in batches (a server-side cursor on PostgreSQL) instead of loading them at once"""
+        try:
+            statement = self._scholarship_query(columns).statement.execution_options(yield_per=batch_size)
+            result = self.session.execute(statement)
+            if columns is None:
+                result = result.scalars()
+            yield from result.partitions()
+        except Exception as e:
+            self.session.rollback()
+            raise e
+    
+    def exists(self) -> bool:
+        """Check whether any scholarships are stored"""
+        try:
+            return self.session.query(Scholarship.id).first() is not None
+        except Exception as e:
+            self.session.rollback()
+            raise e
+    
+    def count(self) -> int:
+        """Count stored scholarships"""
         try:
-            return self.session.query(Scholarship).all()
+            return self.session.query(func.count(Scholarship.id)).scalar()
+        except Exception as e:
+            self.session.rollback()
+            raise e
+    
+    def get_version(self) -> Tuple[int, Optional[int], Optional[datetime]]:
+        """Cheap token that changes whenever scholarships are added, removed or updated"""
+        try:
+            version = self.session.query(
+                func.count(Scholarship.id),
+                func.max(Scholarship.id),
+                func.max(Scholarship.last_updated)
+            ).one()
+            return tuple(version)
         except Exception as e:
             self.session.rollback()
             raise e
@@ -63,13 +161,19 @@ class ScholarshipRepository:
                           max_gpa: Optional[float] = None,
                           sources: Optional[List[str]] = None,
                           limit: int = 100,
-                          offset: int = 0) -> List[Scholarship]:
+                          offset: int = 0,
+                          columns: Optional[Sequence[str]] = None) -> List[Scholarship]:
         """Advanced scholarship search with filters"""
         try:
-            query_obj = self.session.query(Scholarship)
+            query_obj = self._scholarship_query(columns)
             
-            # Text search
-            if query:
+            # Text search: ranked full-text search on PostgreSQL, substring match elsewhere
+            if query and self.session.get_bind().dialect.name == 'postgresql':
+                search_query = func.plainto_tsquery('english', query)
+                query_obj = query_obj.filter(
+                    SCHOLARSHIP_SEARCH_VECTOR.op('@@')(search_query)
+                ).order_by(func.ts_rank(SCHOLARSHIP_SEARCH_VECTOR, search_query).desc())
+            elif query:
                 query_obj = query_obj.filter(
                     or_(
                         Scholarship.title.ilike(f'%{query}%'),
@@ -83,12 +187,9 @@ class ScholarshipRepository:
             if categories:
                 query_obj = query_obj.filter(Scholarship.category.in_(categories))
             
-            # Demographics filter
+            # Demographics filter: scholarships targeting any of the demographics
             if demographics:
-                for demo in demographics:
-                    query_obj = query_obj.filter(
-                        Scholarship.target_demographics.op('?')(demo)
-                    )
+                query_obj = query_obj.filter(self._demographics_filter(demographics, match_all=False))
             
             # Amount range
             if min_amount is not None:
@@ -109,6 +210,22 @@ class ScholarshipRepository:
             self.session.rollback()
             raise e
     
+    def _demographics_filter(self, demographics: List[str], match_all: bool):
+        """Filter on target demographics: an indexed jsonb ?& / ?| test on PostgreSQL, quoted-string LIKEs elsewhere"""
+        if self.session.get_bind().dialect.name == 'postgresql':
+            operator = '?&' if match_all else '?|'
+            return cast(Scholarship.target_demographics, JSONB).op(operator)(array(demographics, type_=Text))
+        
+        serialized = cast(Scholarship.target_demographics, String)
+        conditions = [serialized.like(f'%"{demo}"%') for demo in demographics]
+        return and_(*conditions) if match_all else or_(*conditions)
+    
+    def _scholarship_query(self, columns: Optional[Sequence[str]] = None):
+        """Query for whole Scholarship objects, or for row tuples of the given columns (skipping the ORM identity map)"""
+        if columns is None:
+            return self.session.query(Scholarship)
+        return self.session.query(*(getattr(Scholarship, column) for column in columns))
+    
     def get_scholarships_by_category(self, category: str) -> List[Scholarship]:
         """Get scholarships by category"""
         try:
@@ -120,12 +237,37 @@ class ScholarshipRepository:
     def get_scholarships_by_demographics(self, demographics: List[str]) -> List[Scholarship]:
         """Get scholarships targeting specific demographics"""
         try:
-            query_obj = self.session.query(Scholarship)
-            for demo in demographics:
-                query_obj = query_obj.filter(
-                    Scholarship.target_demographics.op('?')(demo)
-                )
-            return query_obj.all()
+            return self.session.query(Scholarship).filter(
+                self._demographics_filter(demographics, match_all=True)
+            ).all()
+        except Exception as e:
+            self.session.rollback()
+            raise e
+    
+    def distinct_categories(self) -> List[str]:
+        """Get the distinct scholarship categories"""
+        try:
+            return [category for (category,) in self.session.query(Scholarship.category).distinct()]
+        except Exception as e:
+            self.session.rollback()
+            raise e
+    
+    def distinct_demographics(self) -> List[str]:
+        """Get the distinct demographics targeted by any scholarship"""
+        try:
+            if self.session.get_bind().dialect.name == 'postgresql':
+                # Unnest the JSON arrays in the database rather than loading every list
+                demographic = func.json_array_elements_text(Scholarship.target_demographics)
+                query_obj = self.session.query(demographic).filter(
+                    func.json_typeof(Scholarship.target_demographics) == 'array'
+                ).distinct()
+                return [demographic for (demographic,) in query_obj]
+            
+            demographics = set()
+            for (demo_list,) in self.session.query(Scholarship.target_demographics):
+                if isinstance(demo_list, list):
+                    demographics.update(demo_list)
+            return list(demographics)
         except Exception as e:
             self.session.rollback()
             raise e
@@ -182,8 +324,8 @@ class ScholarshipRepository:
 class UserRepository:
     """Repository for user profile operations"""
     
-    def __init__(self):
-        self.session = get_session()
+    def __init__(self, session: Optional[Session] = None):
+        self.session = session if session is not None else get_session()
     
     def close(self):
         """Close database session"""
@@ -236,8 +378,8 @@ class UserRepository:
 class ApplicationRepository:
     """Repository for application tracking operations"""
     
-    def __init__(self):
-        self.session = get_session()
+    def __init__(self, session: Optional[Session] = None):
+        self.session = session if session is not None else get_session()
     
     def close(self):
         """Close database session"""
@@ -255,10 +397,14 @@ class ApplicationRepository:
             self.session.rollback()
             raise e
     
-    def get_user_applications(self, user_id: str) -> List[Application]:
-        """Get all applications for a user"""
+    def get_user_applications(self, user_id: str, columns: Optional[Sequence[str]] = None) -> List[Application]:
+        """Get all applications for a user (as plain row tuples of just these columns, if given)"""
         try:
-            return self.session.query(Application).filter(Application.user_id == user_id).all()
+            if columns is None:
+                query_obj = self.session.query(Application)
+            else:
+                query_obj = self.session.query(*(getattr(Application, column) for column in columns))
+            return query_obj.filter(Application.user_id == user_id).all()
         except Exception as e:
             self.session.rollback()
             raise e
@@ -350,8 +496,8 @@ class ApplicationRepository:
 class SavedScholarshipRepository:
     """Repository for saved scholarship operations"""
     
-    def __init__(self):
-        self.session = get_session()
+    def __init__(self, session: Optional[Session] = None):
+        self.session = session if session is not None else get_session()
     
     def close(self):
         """Close database session"""
@@ -408,8 +554,8 @@ class SavedScholarshipRepository:
 class SearchHistoryRepository:
     """Repository for search history operations"""
     
-    def __init__(self):
-        self.session = get_session()
+    def __init__(self, session: Optional[Session] = None):
+        self.session = session if session is not None else get_session()
     
     def close(self):
         """Close database session"""
@@ -329,9 +329,10 @@ def filter_scholarships_for_user(scholarships_df, user_profile):
         field_mask = scholarships_df['category'].str.contains(
             user_profile['field_of_study'], case=False, na=False
         )
+        field_of_study = user_profile['field_of_study'].lower()
         filtered_df = filtered_df[field_mask | 
                                  scholarships_df['target_demographics'].apply(
-                                     lambda x: user_profile['field_of_study'].lower() in ' '.join(x).lower() if isinstance(x, list) else False
+                                     lambda x: field_of_study in ' '.join(x).lower() if isinstance(x, list) else False
                                  )]
     
     # Filter by academic level
@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 from utils.ai_enhancer import AIEnhancer
 from utils.ai_matching_engine import AdvancedAIMatchingEngine
@@ -291,14 +292,17 @@ def apply_filters(df, search_term, min_amount, max_amount, categories, demograph
     """Apply all filters to the scholarship dataframe"""
     filtered_df = df.copy()
     
+    # Hash the selected categories and demographics once
+    category_set = frozenset(categories)
+    demographic_set = frozenset(demographics)
+    
     # Text search
     if search_term:
-        search_mask = (
-            filtered_df['title'].str.contains(search_term, case=False, na=False) |
-            filtered_df['description'].str.contains(search_term, case=False, na=False) |
-            filtered_df['category'].str.contains(search_term, case=False, na=False) |
-            filtered_df['eligibility_criteria'].str.contains(search_term, case=False, na=False)
-        )
+        # The search term is literal text, so skip the regex engine
+        search_mask = np.zeros(len(filtered_df), dtype=bool)
+        for column in ['title', 'description', 'category', 'eligibility_criteria']:
+            column_mask = filtered_df[column].str.contains(search_term, case=False, na=False, regex=False).to_numpy(dtype=bool)
+            np.logical_or(search_mask, column_mask, out=search_mask)
         filtered_df = filtered_df[search_mask]
     
     # Amount range
@@ -309,20 +313,22 @@ def apply_filters(df, search_term, min_amount, max_amount, categories, demograph
     
     # Categories
     if categories:
-        filtered_df = filtered_df[filtered_df['category'].isin(categories)]
+        filtered_df = filtered_df[filtered_df['category'].isin(category_set)]
     
     # Demographics
     if demographics:
         demo_mask = filtered_df['target_demographics'].apply(
-            lambda x: any(demo in demographics for demo in x)
+            lambda x: not demographic_set.isdisjoint(x)
         )
         filtered_df = filtered_df[demo_mask]
     
     # Academic levels
     if academic_levels:
-        level_mask = filtered_df['eligibility_criteria'].apply(
-            lambda x: any(level.lower() in x.lower() for level in academic_levels)
-        )
+        # Lowercase the criteria column once instead of every row once per level
+        lowered_criteria = filtered_df['eligibility_criteria'].str.lower()
+        level_mask = np.zeros(len(filtered_df), dtype=bool)
+        for level in {level.lower() for level in academic_levels}:
+            np.logical_or(level_mask, lowered_criteria.str.contains(level, na=False, regex=False).to_numpy(dtype=bool), out=level_mask)
         filtered_df = filtered_df[level_mask]
     
     # GPA requirement
@@ -1,20 +1,77 @@
 import pandas as pd
 import numpy as np
+import hashlib
+import pickle
+import weakref
 from sklearn.cluster import KMeans, DBSCAN, AgglomerativeClustering
-from sklearn.preprocessing import StandardScaler, LabelEncoder
-from sklearn.decomposition import PCA
-from sklearn.metrics import silhouette_score
-from typing import Dict, Any, List, Tuple, Optional
+from sklearn.preprocessing import StandardScaler, MaxAbsScaler, LabelEncoder, MultiLabelBinarizer
+from sklearn.decomposition import TruncatedSVD
+from sklearn.metrics import silhouette_score, pairwise_distances
+from typing import Dict, Any, List, Tuple, Optional, Union
+from joblib import Parallel, delayed
+from scipy import sparse
 import streamlit as st
 
+# Shared sklearn K-means settings: Elkan pruning with a single k-means++ initialization
+KMEANS_PARAMS = {
+    'algorithm': 'elkan',
+    'init': 'k-means++',
+    'n_init': 1,
+    'max_iter': 100,
+    'tol': 1e-3,
+    'random_state': 42
+}
+
+# Largest dataset for which the full pairwise distance matrix is precomputed (N x N float32)
+PRECOMPUTED_DISTANCES_MAX_ROWS = 5000
+
+# Above this many points the silhouette score is estimated on a random sample
+SILHOUETTE_SAMPLE_THRESHOLD = 50000
+SILHOUETTE_SAMPLE_SIZE = 2000
+
+def _silhouette(feature_matrix: np.ndarray, cluster_labels: np.ndarray, metric: str = 'euclidean') -> float:
+    """Silhouette score, NaN for degenerate labelings and sampled for very large inputs"""
+    n_points = cluster_labels.shape[0]
+    n_labels = len(np.unique(cluster_labels))
+    if n_labels < 2 or n_labels >= n_points:
+        return float('nan')
+    
+    if n_points > SILHOUETTE_SAMPLE_THRESHOLD:
+        return silhouette_score(feature_matrix, cluster_labels, metric=metric,
+                                sample_size=SILHOUETTE_SAMPLE_SIZE, random_state=42)
+    return silhouette_score(feature_matrix, cluster_labels, metric=metric)
+
+def _fit_and_score(feature_matrix: np.ndarray,
+                   n_clusters: int,
+                   distances: Optional[np.ndarray] = None) -> Tuple[int, Optional[float]]:
+    """Fit K-means with n_clusters and return its silhouette score (None on failure)"""
+    try:
+        kmeans = KMeans(n_clusters=n_clusters, **KMEANS_PARAMS)
+        cluster_labels = kmeans.fit_predict(feature_matrix)
+        if distances is not None:
+            return n_clusters, _silhouette(distances, cluster_labels, metric='precomputed')
+        return n_clusters, _silhouette(feature_matrix, cluster_labels)
+    except:
+        return n_clusters, None
+
 class ScholarshipClustering:
     """Clustering functionality for scholarship data"""
     
     def __init__(self):
         self.scaler = StandardScaler()
+        self.binary_scaler = MaxAbsScaler()
         self.label_encoders = {}
         self.pca = None
         self.feature_names = []
+        self._demo_matrix = None
+        self._demo_classes = None
+        self._demo_cache = {}
+    
+    def __getstate__(self):
+        # The per-dataframe cache holds weak references, which cannot be pickled
+        state = self.__dict__.copy()
+        state['_demo_cache'] = {}
+        return state
     
     def cluster_scholarships(self, 
                            scholarships_df: pd.DataFrame, 
@@ -40,21 +97,13 @@ class ScholarshipClustering:
             features = ["Amount", "Category", "Demographics"]
         
         try:
-            # Prepare features for clustering
-            feature_matrix = self._prepare_features(scholarships_df, features)
+            # Reuse the cached result when the same data and options were clustered before
+            fitted, cluster_labels, cluster_info = _cached_clustering(
+                _dataframe_digest(scholarships_df), scholarships_df, method, n_clusters, tuple(features)
+            )
             
-            if feature_matrix is None or feature_matrix.shape[1] == 0:
-                raise ValueError("No valid features for clustering")
-            
-            # Perform clustering
-            if method == 'kmeans':
-                cluster_labels, cluster_info = self._kmeans_clustering(feature_matrix, n_clusters)
-            elif method == 'hierarchical':
-                cluster_labels, cluster_info = self._hierarchical_clustering(feature_matrix, n_clusters)
-            elif method == 'dbscan':
-                cluster_labels, cluster_info = self._dbscan_clustering(feature_matrix)
-            else:
-                raise ValueError(f"Unsupported clustering method: {method}")
+            # Adopt the fitted scaler/encoders from the clustering run
+            self.__dict__.update(fitted.__dict__)
             
             # Add cluster labels to dataframe
             clustered_df = scholarships_df.copy()
@@ -71,17 +120,46 @@ class ScholarshipClustering:
             st.error(f"Clustering failed: {str(e)}")
             return None, None
     
-    def _prepare_features(self, df: pd.DataFrame, features: List[str]) -> np.ndarray:
-        """Prepare feature matrix for clustering"""
-        feature_columns = []
+    def _run_clustering(self,
+                        scholarships_df: pd.DataFrame,
+                        method: str,
+                        n_clusters: Optional[int],
+                        features: List[str]) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Prepare features and run the selected clustering algorithm"""
+        # Prepare features for clustering
+        feature_matrix = self._prepare_features(scholarships_df, features)
+        
+        if feature_matrix is None or feature_matrix.shape[1] == 0:
+            raise ValueError("No valid features for clustering")
+        
+        # Perform clustering
+        if method == 'kmeans':
+            return self._kmeans_clustering(feature_matrix, n_clusters)
+        elif method == 'hierarchical':
+            return self._hierarchical_clustering(feature_matrix, n_clusters)
+        elif method == 'dbscan':
+            return self._dbscan_clustering(feature_matrix)
+        else:
+            raise ValueError(f"Unsupported clustering method: {method}")
+    
+    def _prepare_features(self, df: pd.DataFrame, features: List[str]) -> Optional[Union[np.ndarray, sparse.csr_matrix]]:
+        """
+        Prepare feature matrix for clustering
+        
+        Numeric features are standardized as a dense block. Binary demographic indicators
+        stay sparse (MaxAbs-scaled), in which case a CSR matrix is returned.
+        """
+        # Numeric feature blocks as 1-D columns or 2-D column groups, copied once into the matrix below
+        feature_blocks = []
+        binary_block = None
         
         # Amount feature
         if "Amount" in features:
-            feature_columns.append(df['amount'].values.reshape(-1, 1))
+            feature_blocks.append(df['amount'].to_numpy())
         
         # GPA Requirement feature
         if "GPA Requirement" in features:
-            feature_columns.append(df['gpa_requirement'].values.reshape(-1, 1))
+            feature_blocks.append(df['gpa_requirement'].to_numpy())
         
         # Category feature (encoded)
         if "Category" in features:
@@ -90,24 +168,17 @@ class ScholarshipClustering:
                 category_encoded = self.label_encoders['category'].fit_transform(df['category'])
             else:
                 category_encoded = self.label_encoders['category'].transform(df['category'])
-            feature_columns.append(category_encoded.reshape(-1, 1))
+            feature_blocks.append(category_encoded)
         
         # Demographics feature (encoded as diversity score and specific encodings)
         if "Demographics" in features:
             # Diversity score (number of demographics)
-            demo_diversity = df['target_demographics'].apply(len).values.reshape(-1, 1)
-            feature_columns.append(demo_diversity)
+            demo_diversity, _, _ = self._ensure_demo_cache(df)
+            feature_blocks.append(demo_diversity)
             
             # Most common demographics as binary features
-            all_demographics = set()
-            for demo_list in df['target_demographics']:
-                all_demographics.update(demo_list)
-            
-            common_demographics = sorted(list(all_demographics))[:10]  # Top 10 most common
-            
-            for demo in common_demographics:
-                demo_binary = df['target_demographics'].apply(lambda x: 1 if demo in x else 0).values.reshape(-1, 1)
-                feature_columns.append(demo_binary)
+            demo_matrix, _ = self._binarize_demographics(df)
+            binary_block = demo_matrix[:, :10]  # Top 10 most common
         
         # Deadline feature (days from now)
         if "Deadline" in features:
@@ -115,30 +186,66 @@ class ScholarshipClustering:
                 deadline_dates = pd.to_datetime(df['deadline'])
                 days_until = (deadline_dates - pd.Timestamp.now()).dt.days
                 days_until = days_until.fillna(365)  # Default to 1 year if invalid
-                feature_columns.append(days_until.values.reshape(-1, 1))
+                feature_blocks.append(days_until.to_numpy())
             except:
                 # If deadline parsing fails, skip this feature
                 pass
         
-        if not feature_columns:
+        if not feature_blocks:
             return None
         
-        # Combine all features
-        feature_matrix = np.hstack(feature_columns)
+        # Combine numeric features into a single preallocated float32 matrix
+        n_rows = len(df)
+        widths = [1 if block.ndim == 1 else block.shape[1] for block in feature_blocks]
+        feature_matrix = np.empty((n_rows, sum(widths)), dtype=np.float32)
+        col = 0
+        for block, width in zip(feature_blocks, widths):
+            feature_matrix[:, col:col + width] = block.reshape(n_rows, width)
+            col += width
         
         # Scale features
         feature_matrix = self.scaler.fit_transform(feature_matrix)
         
+        if binary_block is not None and binary_block.shape[1] > 0:
+            binary_block = self.binary_scaler.fit_transform(binary_block.astype(np.float32))
+            feature_matrix = sparse.hstack([sparse.csr_matrix(feature_matrix), binary_block], format='csr')
+        
         return feature_matrix
     
+    def _ensure_demo_cache(self, df: pd.DataFrame) -> Tuple[np.ndarray, sparse.csr_matrix, np.ndarray]:
+        """
+        Return (list lengths, binary matrix, classes) for df['target_demographics']
+        
+        Results are memoized per dataframe object so repeated feature preparation and
+        summaries on the same frame parse the demographic lists only once.
+        """
+        cached = self._demo_cache.get(id(df))
+        if cached is not None and cached[0]() is df:
+            return cached[1:]
+        
+        demographics = df['target_demographics']
+        lengths = demographics.str.len().fillna(0).to_numpy()
+        mlb = MultiLabelBinarizer(sparse_output=True)
+        demo_matrix = mlb.fit_transform(demographics)
+        
+        # Drop entries whose dataframe has been garbage collected before adding this one
+        self._demo_cache = {key: entry for key, entry in self._demo_cache.items() if entry[0]() is not None}
+        self._demo_cache[id(df)] = (weakref.ref(df), lengths, demo_matrix, mlb.classes_)
+        return lengths, demo_matrix, mlb.classes_
+    
+    def _binarize_demographics(self, df: pd.DataFrame) -> Tuple[sparse.csr_matrix, np.ndarray]:
+        """Encode target demographics as a sparse binary scholarship x demographic matrix"""
+        _, self._demo_matrix, self._demo_classes = self._ensure_demo_cache(df)
+        return self._demo_matrix, self._demo_classes
+    
     def _kmeans_clustering(self, feature_matrix: np.ndarray, n_clusters: int) -> Tuple[np.ndarray, Dict[str, Any]]:
         """Perform K-means clustering"""
-        kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
+        kmeans = KMeans(n_clusters=n_clusters, **KMEANS_PARAMS)
         cluster_labels = kmeans.fit_predict(feature_matrix)
         
         # Calculate clustering quality metrics
-        silhouette_avg = silhouette_score(feature_matrix, cluster_labels)
-        inertia = kmeans.inertia_
+        silhouette_avg = _silhouette(feature_matrix, cluster_labels)
+        inertia = float(kmeans.inertia_)
         
         cluster_info = {
             'silhouette_score': silhouette_avg,
@@ -151,11 +258,15 @@ class ScholarshipClustering:
     
     def _hierarchical_clustering(self, feature_matrix: np.ndarray, n_clusters: int) -> Tuple[np.ndarray, Dict[str, Any]]:
         """Perform hierarchical clustering"""
+        # Ward linkage needs dense input
+        if sparse.issparse(feature_matrix):
+            feature_matrix = feature_matrix.toarray()
+        
         hierarchical = AgglomerativeClustering(n_clusters=n_clusters)
         cluster_labels = hierarchical.fit_predict(feature_matrix)
         
         # Calculate clustering quality metrics
-        silhouette_avg = silhouette_score(feature_matrix, cluster_labels)
+        silhouette_avg = _silhouette(feature_matrix, cluster_labels)
         
         cluster_info = {
             'silhouette_score': silhouette_avg,
@@ -170,23 +281,17 @@ class ScholarshipClustering:
         # Automatically determine eps parameter
         eps = self._estimate_eps(feature_matrix)
         
-        dbscan = DBSCAN(eps=eps, min_samples=max(2, len(feature_matrix) // 20))
+        dbscan = DBSCAN(eps=eps, min_samples=max(2, feature_matrix.shape[0] // 20))
         cluster_labels = dbscan.fit_predict(feature_matrix)
         
         # Handle noise points (labeled as -1) by assigning them to a separate cluster
-        unique_labels = np.unique(cluster_labels)
-        n_clusters = len(unique_labels) - (1 if -1 in unique_labels else 0)
-        n_noise = list(cluster_labels).count(-1)
+        # DBSCAN labels clusters 0..k-1, so the largest label gives the cluster count
+        non_noise_mask = cluster_labels != -1
+        n_noise = int(len(cluster_labels) - non_noise_mask.sum())
+        n_clusters = int(cluster_labels.max()) + 1 if non_noise_mask.any() else 0
         
         # Calculate clustering quality metrics (only for non-noise points)
-        if n_clusters > 1 and n_noise < len(cluster_labels):
-            non_noise_mask = cluster_labels != -1
-            if np.sum(non_noise_mask) > 1:
-                silhouette_avg = silhouette_score(feature_matrix[non_noise_mask], cluster_labels[non_noise_mask])
-            else:
-                silhouette_avg = 0
-        else:
-            silhouette_avg = 0
+        silhouette_avg = _silhouette(feature_matrix[non_noise_mask], cluster_labels[non_noise_mask])
         
         cluster_info = {
             'silhouette_score': silhouette_avg,
@@ -202,7 +307,7 @@ class ScholarshipClustering:
         from sklearn.neighbors import NearestNeighbors
         
         # Use k=4 as a rule of thumb
-        k = min(4, len(feature_matrix) - 1)
+        k = min(4, feature_matrix.shape[0] - 1)
         if k <= 0:
             return 0.5
         
@@ -222,43 +327,68 @@ class ScholarshipClustering:
         """Generate summaries for each cluster"""
         summaries = {}
         
-        for cluster_id in clustered_df['cluster'].unique():
-            cluster_data = clustered_df[clustered_df['cluster'] == cluster_id]
-            
+        # Amount/GPA statistics for every cluster in a single grouped pass
+        cluster_stats = clustered_df.groupby('cluster').agg(
+            size=('amount', 'size'),
+            avg_amount=('amount', 'mean'),
+            total_value=('amount', 'sum'),
+            amount_min=('amount', 'min'),
+            amount_max=('amount', 'max'),
+            avg_gpa=('gpa_requirement', 'mean'),
+            gpa_min=('gpa_requirement', 'min'),
+            gpa_max=('gpa_requirement', 'max')
+        )
+        
+        # Category counts per cluster, sorted by frequency within each cluster
+        cluster_category_counts = clustered_df.groupby('cluster')['category'].value_counts()
+        
+        # Demographic indicator matrix shared by all clusters
+        demo_matrix, demo_classes = self._binarize_demographics(clustered_df)
+        cluster_labels = clustered_df['cluster'].to_numpy()
+        
+        # Parse deadlines once for the whole frame and aggregate per cluster
+        try:
+            deadline_dates = pd.to_datetime(clustered_df['deadline'], errors='coerce')
+            days_until = (deadline_dates - pd.Timestamp.now()).dt.days
+            deadline_stats = pd.DataFrame({
+                'avg_days': days_until.groupby(clustered_df['cluster']).mean(),
+                'urgent': (days_until <= 30).groupby(clustered_df['cluster']).sum()
+            })
+        except:
+            deadline_stats = None
+        
+        for cluster_id in cluster_stats.index:
             # Basic statistics
             summary = {
-                'size': len(cluster_data),
-                'avg_amount': cluster_data['amount'].mean(),
-                'total_value': cluster_data['amount'].sum(),
-                'amount_range': (cluster_data['amount'].min(), cluster_data['amount'].max()),
-                'avg_gpa': cluster_data['gpa_requirement'].mean(),
-                'gpa_range': (cluster_data['gpa_requirement'].min(), cluster_data['gpa_requirement'].max())
+                'size': int(cluster_stats.at[cluster_id, 'size']),
+                'avg_amount': cluster_stats.at[cluster_id, 'avg_amount'],
+                'total_value': cluster_stats.at[cluster_id, 'total_value'],
+                'amount_range': (cluster_stats.at[cluster_id, 'amount_min'], cluster_stats.at[cluster_id, 'amount_max']),
+                'avg_gpa': cluster_stats.at[cluster_id, 'avg_gpa'],
+                'gpa_range': (cluster_stats.at[cluster_id, 'gpa_min'], cluster_stats.at[cluster_id, 'gpa_max'])
             }
             
             # Most common category
-            category_counts = cluster_data['category'].value_counts()
+            category_counts = cluster_category_counts.loc[cluster_id]
             summary['most_common_category'] = category_counts.index[0] if not category_counts.empty else "N/A"
             summary['category_distribution'] = category_counts.to_dict()
             
             # Most common demographics
-            all_demographics = []
-            for demo_list in cluster_data['target_demographics']:
-                all_demographics.extend(demo_list)
-            
-            if all_demographics:
-                from collections import Counter
-                demo_counts = Counter(all_demographics)
-                summary['most_common_demographics'] = dict(demo_counts.most_common(5))
+            demo_counts = np.asarray(demo_matrix[cluster_labels == cluster_id].sum(axis=0)).ravel()
+            if len(demo_counts) > 5:
+                top_demos = np.argpartition(-demo_counts, 5)[:5]
             else:
-                summary['most_common_demographics'] = {}
+                top_demos = np.arange(len(demo_counts))
+            top_demos = top_demos[np.argsort(-demo_counts[top_demos], kind='stable')]
+            summary['most_common_demographics'] = {
+                demo_classes[i]: int(demo_counts[i]) for i in top_demos if demo_counts[i] > 0
+            }
             
             # Deadline analysis
-            try:
-                deadline_dates = pd.to_datetime(cluster_data['deadline'])
-                days_until = (deadline_dates - pd.Timestamp.now()).dt.days
-                summary['avg_days_until_deadline'] = days_until.mean()
-                summary['urgent_deadlines'] = (days_until <= 30).sum()
-            except:
+            if deadline_stats is not None:
+                summary['avg_days_until_deadline'] = deadline_stats.at[cluster_id, 'avg_days']
+                summary['urgent_deadlines'] = deadline_stats.at[cluster_id, 'urgent']
+            else:
                 summary['avg_days_until_deadline'] = None
                 summary['urgent_deadlines'] = 0
             
@@ -277,16 +407,17 @@ class ScholarshipClustering:
         
         # Test different numbers of clusters
         max_clusters = min(10, len(scholarships_df) // 2)  # Don't exceed half the data points
-        scores = {}
         
-        for n in range(2, max_clusters + 1):
-            try:
-                kmeans = KMeans(n_clusters=n, random_state=42, n_init=10)
-                cluster_labels = kmeans.fit_predict(feature_matrix)
-                score = silhouette_score(feature_matrix, cluster_labels)
-                scores[n] = score
-            except:
-                continue
+        # Pairwise distances don't depend on k, so compute them once for every silhouette score
+        distances = None
+        if feature_matrix.shape[0] <= PRECOMPUTED_DISTANCES_MAX_ROWS:
+            distances = pairwise_distances(feature_matrix, metric='euclidean').astype(np.float32, copy=False)
+        
+        # Each k is independent, so fit them concurrently across cores
+        results = Parallel(n_jobs=-1, prefer='processes')(
+            delayed(_fit_and_score)(feature_matrix, n, distances) for n in range(2, max_clusters + 1)
+        )
+        scores = {n: score for n, score in results if score is not None and not np.isnan(score)}
         
         if not scores:
             return {'recommended_clusters': 2, 'scores': {}, 'method': 'default'}
@@ -301,12 +432,12 @@ class ScholarshipClustering:
         }
     
     def visualize_clusters_2d(self, clustered_df: pd.DataFrame, feature_matrix: np.ndarray) -> Dict[str, Any]:
-        """Prepare data for 2D visualization using PCA"""
+        """Prepare data for 2D visualization using truncated SVD (works on sparse features)"""
         if feature_matrix.shape[1] < 2:
             return None
         
-        # Apply PCA to reduce to 2 dimensions
-        self.pca = PCA(n_components=2, random_state=42)
+        # Reduce to 2 dimensions
+        self.pca = TruncatedSVD(n_components=2, random_state=42)
         coordinates_2d = self.pca.fit_transform(feature_matrix)
         
         # Create visualization data
@@ -322,3 +453,23 @@ class ScholarshipClustering:
         }
         
         return viz_data
+
+def _dataframe_digest(df: pd.DataFrame) -> str:
+    """Stable content hash of a dataframe, used as the clustering cache key"""
+    try:
+        payload = df.to_parquet()
+    except Exception:
+        # Parquet cannot encode some mixed-type object columns
+        payload = pickle.dumps(df, pickle.HIGHEST_PROTOCOL)
+    return hashlib.sha256(payload).hexdigest()
+
+@st.cache_data(show_spinner=False)
+def _cached_clustering(data_digest: str,
+                       _scholarships_df: pd.DataFrame,
+                       method: str,
+                       n_clusters: Optional[int],
+                       features: Tuple[str, ...]) -> Tuple[ScholarshipClustering, np.ndarray, Dict[str, Any]]:
+    """Cluster scholarships, memoized on the dataframe contents and clustering options"""
+    clustering = ScholarshipClustering()
+    cluster_labels, cluster_info = clustering._run_clustering(_scholarships_df, method, n_clusters, list(features))
+    return clustering, cluster_labels, cluster_info
@@ -1,21 +1,516 @@
 import requests
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import json
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Mapping, Tuple, Iterator
+from types import MappingProxyType
+from functools import lru_cache
 import streamlit as st
 from datetime import datetime, timedelta
 import time
+import sys
+from concurrent.futures import ThreadPoolExecutor
 import re
+import logging
+import os
+
+log = logging.getLogger(__name__)
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+try:
+    import redis
+    _HAS_REDIS = True
+except ImportError:
+    _HAS_REDIS = False
+
+# Shared cache for aggregated scholarships, so every worker process reuses one result
+AGGREGATE_CACHE_KEY = 'scholarsphere:agg:v1'
+AGGREGATE_CACHE_TTL = 3600
+
+# Threads used to overlap the scholarship fetchers
+FETCH_WORKERS = 8
+
+# Keyword -> canonical demographic; the longest keyword found in a demographic wins
+DEMOGRAPHIC_MAPPING = {
+    'minority': 'Underrepresented minority',
+    'african american': 'Underrepresented minority',
+    'hispanic': 'Underrepresented minority',
+    'latino': 'Underrepresented minority',
+    'native american': 'Native American',
+    'women': 'Women in STEM',
+    'female': 'Women in STEM',
+    'lgbtq': 'LGBTQ+',
+    'lgbt': 'LGBTQ+',
+    'disability': 'Student with disability',
+    'disabled': 'Student with disability',
+    'low income': 'Low-income background',
+    'financial need': 'Low-income background',
+    'first generation': 'First-generation college student',
+    'first-gen': 'First-generation college student',
+    'veteran': 'Veteran',
+    'military': 'Veteran',
+    'international': 'International student'
+}
+
+# Keywords longest first (ties keep mapping order), so a longer, more specific keyword always wins
+_DEMO_PAIRS = tuple(sorted(DEMOGRAPHIC_MAPPING.items(), key=lambda pair: -len(pair[0])))
+
+def _dumps(data: Any) -> bytes:
+    """Serialize cache payloads, using orjson when it is installed"""
+    if _HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data).encode('utf-8')
+
+def _loads(payload: bytes) -> Any:
+    """Deserialize cache payloads, using orjson when it is installed"""
+    if _HAS_ORJSON:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+# Low-cardinality string fields whose values are shared between records
+_INTERNED_FIELDS = ('category', 'source', 'verification_status', 'application_difficulty')
+
+def _freeze_scholarships(scholarships: List[Dict[str, Any]]) -> Tuple[Mapping[str, Any], ...]:
+    """Build a read-only scholarship table that can be shared across calls"""
+    frozen = []
+    for scholarship in scholarships:
+        record = dict(scholarship)
+        for field in _INTERNED_FIELDS:
+            if isinstance(record.get(field), str):
+                record[field] = sys.intern(record[field])
+        record['target_demographics'] = tuple(sys.intern(demo) for demo in record['target_demographics'])
+        frozen.append(MappingProxyType(record))
+    return tuple(frozen)
+
+# Federal government scholarships
+_GOVERNMENT_SCHOLARSHIPS = _freeze_scholarships([
+    {
+        'title': 'Federal Pell Grant',
+        'amount': 7395,
+        'category': 'General',
+        'target_demographics': ['Low-income background'],
+        'description': 'Federal grant for undergraduate students with exceptional financial need',
+        'eligibility_criteria': 'Undergraduate students with demonstrated financial need, U.S. citizens or eligible non-citizens',
+        'application_requirements': 'FAFSA (Free Application for Federal Student Aid)',
+        'deadline': '06/30/2025',
+        'gpa_requirement': 0.0,
+        'website': 'https://studentaid.gov/understand-aid/types/grants/pell',
+        'contact_info': 'Federal Student Aid Information Center: 1-800-433-3243',
+        'source': 'federal_government'
+    },
+    {
+        'title': 'Federal Supplemental Educational Opportunity Grant (SEOG)',
+        'amount': 4000,
+        'category': 'General',
+        'target_demographics': ['Low-income background'],
+        'description': 'Federal grant for undergraduate students with exceptional financial need',
+        'eligibility_criteria': 'Undergraduate students with exceptional financial need, priority to Pell Grant recipients',
+        'application_requirements': 'FAFSA, contact school financial aid office',
+        'deadline': '06/30/2025',
+        'gpa_requirement': 0.0,
+        'website': 'https://studentaid.gov/understand-aid/types/grants/fseog',
+        'contact_info': 'School financial aid office',
+        'source': 'federal_government'
+    },
+    {
+        'title': 'TEACH Grant',
+        'amount': 4000,
+        'category': 'Education',
+        'target_demographics': ['Future teachers'],
+        'description': 'Grant for students who plan to teach in high-need fields in low-income schools',
+        'eligibility_criteria': 'Students in teacher preparation programs, commit to teaching in high-need field for 4 years',
+        'application_requirements': 'FAFSA, TEACH Grant Agreement to Serve',
+        'deadline': '06/30/2025',
+        'gpa_requirement': 3.25,
+        'website': 'https://studentaid.gov/understand-aid/types/grants/teach',
+        'contact_info': 'School financial aid office',
+        'source': 'federal_government'
+    }
+])
+
+# Major foundations and organizations
+_FOUNDATION_SCHOLARSHIPS = _freeze_scholarships([
+    {
+        'title': 'Gates Scholarship',
+        'amount': 50000,
+        'category': 'General',
+        'target_demographics': ['Underrepresented minority', 'Low-income background'],
+        'description': 'Full scholarship for outstanding minority students with significant financial need',
+        'eligibility_criteria': 'High school seniors, U.S. citizens, from minority backgrounds, Pell Grant eligible',
+        'application_requirements': 'Online application, essays, transcripts, recommendations, financial documents',
+        'deadline': '09/15/2025',
+        'gpa_requirement': 3.3,
+        'website': 'https://www.thegatesscholarship.org',
+        'contact_info': 'info@thegatesscholarship.org',
+        'source': 'gates_foundation'
+    },
+    {
+        'title': 'Jack Kent Cooke Foundation College Scholarship',
+        'amount': 40000,
+        'category': 'General',
+        'target_demographics': ['High-achieving students', 'Low-income background'],
+        'description': 'Scholarship for high-achieving students with financial need',
+        'eligibility_criteria': 'High school seniors, financial need, academic excellence, leadership',
+        'application_requirements': 'Online application, essays, transcripts, recommendations, financial aid forms',
+        'deadline': '11/18/2024',
+        'gpa_requirement': 3.5,
+        'website': 'https://www.jkcf.org',
+        'contact_info': 'scholarships@jkcf.org',
+        'source': 'cooke_foundation'
+    },
+    {
+        'title': 'Coca-Cola Scholars Program',
+        'amount': 20000,
+        'category': 'General',
+        'target_demographics': ['Leadership', 'Community service'],
+        'description': 'Merit-based scholarship recognizing academic excellence and leadership',
+        'eligibility_criteria': 'High school seniors, U.S. citizens, academic achievement, leadership experience',
+        'application_requirements': 'Online application, transcripts, activities list, essays',
+        'deadline': '10/31/2024',
+        'gpa_requirement': 3.0,
+        'website': 'https://www.coca-colascholarsfoundation.org',
+        'contact_info': 'scholars@coca-cola.com',
+        'source': 'coca_cola_foundation'
+    }
+])
+
+# Corporate scholarships
+_CORPORATE_SCHOLARSHIPS = _freeze_scholarships([
+    {
+        'title': 'Google Lime Scholarship',
+        'amount': 10000,
+        'category': 'Computer Science',
+        'target_demographics': ['Student with disability'],
+        'description': 'Scholarship for students with disabilities pursuing computer science',
+        'eligibility_criteria': 'Students with disabilities, pursuing computer science or related field',
+        'application_requirements': 'Online application, transcripts, essays, documentation of disability',
+        'deadline': '12/04/2024',
+        'gpa_requirement': 3.7,
+        'website': 'https://www.limeconnect.com/programs/page/google-lime-scholarship',
+        'contact_info': 'info@limeconnect.com',
+        'source': 'google_lime'
+    },
+    {
+        'title': 'Microsoft Scholarship Program',
+        'amount': 12000,
+        'category': 'Computer Science',
+        'target_demographics': ['Underrepresented minority', 'Women in STEM'],
+        'description': 'Scholarship for underrepresented students in computer science and related STEM fields',
+        'eligibility_criteria': 'Underrepresented minorities and women in computer science, engineering, or math',
+        'application_requirements': 'Online application, transcripts, essays, resume, recommendations',
+        'deadline': '01/31/2025',
+        'gpa_requirement': 3.0,
+        'website': 'https://careers.microsoft.com/students/us/en/usscholarshipprogram',
+        'contact_info': 'scholarships@microsoft.com',
+        'source': 'microsoft'
+    },
+    {
+        'title': 'Amazon Future Engineer Scholarship',
+        'amount': 40000,
+        'category': 'Computer Science',
+        'target_demographics': ['Underrepresented minority', 'Low-income background'],
+        'description': 'Four-year scholarship plus internship for underrepresented students in computer science',
+        'eligibility_criteria': 'High school seniors from underrepresented groups, planning to study computer science',
+        'application_requirements': 'Online application, transcripts, essays, financial information',
+        'deadline': '01/17/2025',
+        'gpa_requirement': 3.0,
+        'website': 'https://www.amazonfutureengineer.com/scholarships',
+        'contact_info': 'amazonfutureengineer@amazon.com',
+        'source': 'amazon'
+    }
+])
+
+# Professional organizations and associations
+_ORGANIZATION_SCHOLARSHIPS = _freeze_scholarships([
+    {
+        'title': 'Society of Women Engineers Scholarship',
+        'amount': 15000,
+        'category': 'Engineering',
+        'target_demographics': ['Women in STEM'],
+        'description': 'Scholarships for women pursuing engineering degrees',
+        'eligibility_criteria': 'Women studying engineering or computer science, various GPA requirements',
+        'application_requirements': 'Online application, transcripts, essays, references',
+        'deadline': '02/15/2025',
+        'gpa_requirement': 3.0,
+        'website': 'https://scholarships.swe.org',
+        'contact_info': 'scholarships@swe.org',
+        'source': 'swe'
+    },
+    {
+        'title': 'National Society of Black Engineers Scholarship',
+        'amount': 10000,
+        'category': 'Engineering',
+        'target_demographics': ['Underrepresented minority'],
+        'description': 'Scholarships for Black students in engineering and technology fields',
+        'eligibility_criteria': 'Black/African American students in engineering, computer science, or technology',
+        'application_requirements': 'Online application, transcripts, essays, NSBE membership preferred',
+        'deadline': '01/31/2025',
+        'gpa_requirement': 3.2,
+        'website': 'https://www.nsbe.org/scholarships',
+        'contact_info': 'scholarships@nsbe.org',
+        'source': 'nsbe'
+    },
+    {
+        'title': 'Hispanic Scholarship Fund',
+        'amount': 5000,
+        'category': 'General',
+        'target_demographics': ['Underrepresented minority'],
+        'description': 'Scholarships for Hispanic/Latino students pursuing higher education',
+        'eligibility_criteria': 'Hispanic heritage, U.S. citizenship or legal permanent residency, minimum GPA',
+        'application_requirements': 'Online application, transcripts, FAFSA, essays',
+        'deadline': '03/30/2025',
+        'gpa_requirement': 3.0,
+        'website': 'https://www.hsf.net/scholarships',
+        'contact_info': 'scholar1@hsf.net',
+        'source': 'hsf'
+    }
+])
+
+# Major universities
+_UNIVERSITY_SCHOLARSHIPS = _freeze_scholarships([
+    {
+        'title': 'Stanford Knight-Hennessy Scholars',
+        'amount': 75000,
+        'category': 'General',
+        'target_demographics': ['Graduate students', 'International student'],
+        'description': 'Full funding for graduate study at Stanford University',
+        'eligibility_criteria': 'Applying to graduate programs at Stanford, leadership potential, civic commitment',
+        'application_requirements': 'Stanford graduate application, additional Knight-Hennessy application',
+        'deadline': '10/10/2024',
+        'gpa_requirement': 3.8,
+        'website': 'https://knight-hennessy.stanford.edu',
+        'contact_info': 'kh-program@stanford.edu',
+        'source': 'stanford'
+    },
+    {
+        'title': 'Harvard University Need-Based Aid',
+        'amount': 70000,
+        'category': 'General',
+        'target_demographics': ['Low-income background'],
+        'description': 'Need-based financial aid covering full cost of attendance',
+        'eligibility_criteria': 'Admitted Harvard students with family income below $85,000',
+        'application_requirements': 'CSS Profile, FAFSA, tax returns, financial documents',
+        'deadline': '02/01/2025',
+        'gpa_requirement': 0.0,
+        'website': 'https://college.harvard.edu/financial-aid',
+        'contact_info': 'fao@fas.harvard.edu',
+        'source': 'harvard'
+    },
+    {
+        'title': 'MIT Need-Based Financial Aid',
+        'amount': 65000,
+        'category': 'STEM',
+        'target_demographics': ['Low-income background'],
+        'description': 'Need-based aid for families earning less than $90,000',
+        'eligibility_criteria': 'Admitted MIT students, family income below $90,000',
+        'application_requirements': 'CSS Profile, FAFSA, tax returns',
+        'deadline': '02/15/2025',
+        'gpa_requirement': 0.0,
+        'website': 'https://sfs.mit.edu',
+        'contact_info': 'sfs@mit.edu',
+        'source': 'mit'
+    }
+])
+
+# State-specific scholarships
+_STATE_SCHOLARSHIPS = _freeze_scholarships([
+    {
+        'title': 'California Cal Grant A',
+        'amount': 12570,
+        'category': 'General',
+        'target_demographics': ['California residents'],
+        'description': 'State grant for California residents attending California colleges',
+        'eligibility_criteria': 'California residents, financial need, minimum GPA requirements',
+        'application_requirements': 'FAFSA or California Dream Act Application, GPA verification',
+        'deadline': '03/02/2025',
+        'gpa_requirement': 3.0,
+        'website': 'https://www.csac.ca.gov/cal-grants',
+        'contact_info': 'studentsupport@csac.ca.gov',
+        'source': 'california_state'
+    },
+    {
+        'title': 'Texas TEXAS Grant',
+        'amount': 10000,
+        'category': 'General',
+        'target_demographics': ['Texas residents'],
+        'description': 'Need-based grant for Texas residents attending Texas public universities',
+        'eligibility_criteria': 'Texas residents, financial need, complete high school curriculum',
+        'application_requirements': 'FAFSA, meet Texas Success Initiative requirements',
+        'deadline': '03/15/2025',
+        'gpa_requirement': 2.5,
+        'website': 'https://www.thecb.state.tx.us/texas-grant',
+        'contact_info': 'grantinfo@thecb.state.tx.us',
+        'source': 'texas_state'
+    },
+    {
+        'title': 'New York Excelsior Scholarship',
+        'amount': 6470,
+        'category': 'General',
+        'target_demographics': ['New York residents'],
+        'description': 'Tuition award for middle-class families attending SUNY or CUNY schools',
+        'eligibility_criteria': 'New York residents, family income up to $125,000, attend SUNY/CUNY',
+        'application_requirements': 'FAFSA, NYS Student Aid Application',
+        'deadline': '06/30/2025',
+        'gpa_requirement': 2.0,
+        'website': 'https://www.hesc.ny.gov/pay-for-college/apply-for-financial-aid/nys-grants-scholarships-and-awards/the-excelsior-scholarship.html',
+        'contact_info': 'info@hesc.ny.gov',
+        'source': 'new_york_state'
+    }
+])
+
+# Specific fields and demographics
+_SPECIALTY_SCHOLARSHIPS = _freeze_scholarships([
+    {
+        'title': 'Point Foundation LGBTQ Scholarship',
+        'amount': 27000,
+        'category': 'General',
+        'target_demographics': ['LGBTQ+'],
+        'description': 'Scholarship and mentorship for LGBTQ students',
+        'eligibility_criteria': 'LGBTQ students, academic merit, financial need, leadership potential',
+        'application_requirements': 'Online application, essays, transcripts, recommendations, financial documents',
+        'deadline': '01/27/2025',
+        'gpa_requirement': 3.2,
+        'website': 'https://pointfoundation.org/point-apply/application-requirements/',
+        'contact_info': 'info@pointfoundation.org',
+        'source': 'point_foundation'
+    },
+    {
+        'title': 'American Indian College Fund Scholarship',
+        'amount': 8000,
+        'category': 'General',
+        'target_demographics': ['Native American'],
+        'description': 'Scholarships for Native American students attending tribal and mainstream colleges',
+        'eligibility_criteria': 'Native American heritage, enrolled member of federally recognized tribe',
+        'application_requirements': 'Online application, tribal enrollment verification, transcripts, essays',
+        'deadline': '05/31/2025',
+        'gpa_requirement': 2.0,
+        'website': 'https://collegefund.org/students/scholarships/',
+        'contact_info': 'scholarships@collegefund.org',
+        'source': 'aicf'
+    },
+    {
+        'title': 'United Negro College Fund Scholarship',
+        'amount': 7500,
+        'category': 'General',
+        'target_demographics': ['Underrepresented minority'],
+        'description': 'Scholarships for African American students attending UNCF member schools',
+        'eligibility_criteria': 'African American students, attending UNCF member institution, financial need',
+        'application_requirements': 'Online application, FAFSA, transcripts, essays, recommendations',
+        'deadline': '06/30/2025',
+        'gpa_requirement': 2.5,
+        'website': 'https://uncf.org/scholarships',
+        'contact_info': 'scholarshiphelp@uncf.org',
+        'source': 'uncf'
+    }
+])
+
+# Requirement keyword -> difficulty points, counted once per scholarship
+REQUIREMENT_WEIGHTS = (('essay', 1), ('recommendation', 1), ('portfolio', 2))
+
+# Every static record, in aggregation order
+_ALL_SCHOLARSHIPS = (
+    _GOVERNMENT_SCHOLARSHIPS + _FOUNDATION_SCHOLARSHIPS + _CORPORATE_SCHOLARSHIPS
+    + _ORGANIZATION_SCHOLARSHIPS + _UNIVERSITY_SCHOLARSHIPS + _STATE_SCHOLARSHIPS
+    + _SPECIALTY_SCHOLARSHIPS
+)
+
+@lru_cache(maxsize=4096)
+def _match_demographic(demo_lower: str) -> Optional[str]:
+    """Return the canonical category of the longest mapping keyword found in a demographic"""
+    for keyword, canonical in _DEMO_PAIRS:
+        if keyword in demo_lower:
+            return canonical
+    return None
+
+def _standardize_demographics(demographics: List[str]) -> List[str]:
+    """Standardize demographic categories"""
+    standardized = []
+    seen = set()
+    
+    for demo in demographics:
+        value = _match_demographic(demo.lower())
+        if value is None:
+            standardized.append(demo)
+            seen.add(demo)
+        elif value not in seen:
+            standardized.append(value)
+            seen.add(value)
+    
+    return standardized or ['General']
+
+def _score_scholarships(scholarships: List[Mapping[str, Any]], last_updated: Optional[str]) -> List[Dict[str, Any]]:
+    """Add standardized fields to every scholarship record in one vectorized pass"""
+    if not scholarships:
+        return []
+    
+    # Only the columns scoring reads are pulled out of the records, as flat arrays
+    count = len(scholarships)
+    amount = np.fromiter((scholarship.get('amount') or 0 for scholarship in scholarships), dtype=float, count=count)
+    gpa_req = np.fromiter((scholarship.get('gpa_requirement') or 0 for scholarship in scholarships), dtype=float, count=count)
+    requirements = np.array([
+        requirement.lower() if isinstance(requirement, str) else ''
+        for requirement in (scholarship.get('application_requirements') for scholarship in scholarships)
+    ])
+    
+    difficulty_score = np.select([gpa_req >= 3.5, gpa_req >= 3.0], [2, 1], default=0)
+    for keyword, weight in REQUIREMENT_WEIGHTS:
+        difficulty_score += weight * (np.char.find(requirements, keyword) >= 0)
+    
+    difficulty = np.select(
+        [difficulty_score >= 4, difficulty_score >= 2], ['High', 'Medium'], default='Low'
+    )
+    estimated_applicants = np.select(
+        [amount >= 50000, amount >= 20000, amount >= 10000, amount >= 5000],
+        [5000, 2000, 1000, 500],
+        default=200
+    )
+    
+    # New records leave the shared source tables untouched
+    return [
+        {
+            **scholarship,
+            'last_updated': last_updated,
+            'verification_status': 'verified',
+            'application_difficulty': level,
+            'estimated_applicants': applicants,
+            'target_demographics': _standardize_demographics(scholarship.get('target_demographics', []))
+        }
+        for scholarship, level, applicants in zip(scholarships, difficulty.tolist(), estimated_applicants.tolist())
+    ]
+
+# The static tables never change, so their enrichment is computed once at import. It is keyed on
+# (title, source) rather than object identity so copies rebuilt from the Redis cache still hit
+_ENRICHED_SCHOLARSHIPS = {
+    (scholarship['title'], scholarship['source']): (scholarship, enriched)
+    for scholarship, enriched in zip(
+        _ALL_SCHOLARSHIPS, _freeze_scholarships(_score_scholarships(_ALL_SCHOLARSHIPS, None))
+    )
+}
+
+def _precomputed_enrichment(scholarship: Mapping[str, Any]) -> Optional[Mapping[str, Any]]:
+    """The import-time enrichment of a static-table record, if the record is unchanged"""
+    entry = _ENRICHED_SCHOLARSHIPS.get((scholarship.get('title'), scholarship.get('source')))
+    if entry is None:
+        return None
+    source_record, enriched = entry
+    return enriched if scholarship is source_record or scholarship == source_record else None
 
 class RealScholarshipIntegrator:
     """Integration with real scholarship data sources"""
     
+    # Pooled HTTP session shared by every integrator instance
+    _session = None
+    
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'ScholarSphere/1.0 Educational Platform',
-            'Accept': 'application/json'
-        })
+        self.session = self._shared_session()
+        # Source failures from the last aggregation, for the UI to report
+        self.last_errors = []
         self.base_sources = [
             'https://www.scholarships.com',
             'https://www.fastweb.com',
@@ -24,355 +519,94 @@ class RealScholarshipIntegrator:
             'https://www.college-scholarships.com'
         ]
     
-    def fetch_government_scholarships(self) -> List[Dict[str, Any]]:
+    @classmethod
+    def _shared_session(cls) -> requests.Session:
+        """Create the HTTP session once so connections are reused across integrators"""
+        if cls._session is None:
+            session = requests.Session()
+            session.headers.update({
+                'User-Agent': 'ScholarSphere/1.0 Educational Platform',
+                'Accept': 'application/json'
+            })
+            adapter = HTTPAdapter(
+                pool_connections=20,
+                pool_maxsize=50,
+                max_retries=Retry(total=3, backoff_factor=0.3)
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            cls._session = session
+        return cls._session
+    
+    def fetch_government_scholarships(self) -> Iterator[Mapping[str, Any]]:
         """Fetch federal and state government scholarships"""
-        scholarships = []
-        
-        # Federal government scholarships
-        federal_scholarships = [
-            {
-                'title': 'Federal Pell Grant',
-                'amount': 7395,
-                'category': 'General',
-                'target_demographics': ['Low-income background'],
-                'description': 'Federal grant for undergraduate students with exceptional financial need',
-                'eligibility_criteria': 'Undergraduate students with demonstrated financial need, U.S. citizens or eligible non-citizens',
-                'application_requirements': 'FAFSA (Free Application for Federal Student Aid)',
-                'deadline': '06/30/2025',
-                'gpa_requirement': 0.0,
-                'website': 'https://studentaid.gov/understand-aid/types/grants/pell',
-                'contact_info': 'Federal Student Aid Information Center: 1-800-433-3243',
-                'source': 'federal_government'
-            },
-            {
-                'title': 'Federal Supplemental Educational Opportunity Grant (SEOG)',
-                'amount': 4000,
-                'category': 'General',
-                'target_demographics': ['Low-income background'],
-                'description': 'Federal grant for undergraduate students with exceptional financial need',
-                'eligibility_criteria': 'Undergraduate students with exceptional financial need, priority to Pell Grant recipients',
-                'application_requirements': 'FAFSA, contact school financial aid office',
-                'deadline': '06/30/2025',
-                'gpa_requirement': 0.0,
-                'website': 'https://studentaid.gov/understand-aid/types/grants/fseog',
-                'contact_info': 'School financial aid office',
-                'source': 'federal_government'
-            },
-            {
-                'title': 'TEACH Grant',
-                'amount': 4000,
-                'category': 'Education',
-                'target_demographics': ['Future teachers'],
-                'description': 'Grant for students who plan to teach in high-need fields in low-income schools',
-                'eligibility_criteria': 'Students in teacher preparation programs, commit to teaching in high-need field for 4 years',
-                'application_requirements': 'FAFSA, TEACH Grant Agreement to Serve',
-                'deadline': '06/30/2025',
-                'gpa_requirement': 3.25,
-                'website': 'https://studentaid.gov/understand-aid/types/grants/teach',
-                'contact_info': 'School financial aid office',
-                'source': 'federal_government'
-            }
-        ]
-        
-        scholarships.extend(federal_scholarships)
-        return scholarships
+        return iter(_GOVERNMENT_SCHOLARSHIPS)
     
-    def fetch_foundation_scholarships(self) -> List[Dict[str, Any]]:
+    def fetch_foundation_scholarships(self) -> Iterator[Mapping[str, Any]]:
         """Fetch scholarships from major foundations and organizations"""
-        foundation_scholarships = [
-            {
-                'title': 'Gates Scholarship',
-                'amount': 50000,
-                'category': 'General',
-                'target_demographics': ['Underrepresented minority', 'Low-income background'],
-                'description': 'Full scholarship for outstanding minority students with significant financial need',
-                'eligibility_criteria': 'High school seniors, U.S. citizens, from minority backgrounds, Pell Grant eligible',
-                'application_requirements': 'Online application, essays, transcripts, recommendations, financial documents',
-                'deadline': '09/15/2025',
-                'gpa_requirement': 3.3,
-                'website': 'https://www.thegatesscholarship.org',
-                'contact_info': 'info@thegatesscholarship.org',
-                'source': 'gates_foundation'
-            },
-            {
-                'title': 'Jack Kent Cooke Foundation College Scholarship',
-                'amount': 40000,
-                'category': 'General',
-                'target_demographics': ['High-achieving students', 'Low-income background'],
-                'description': 'Scholarship for high-achieving students with financial need',
-                'eligibility_criteria': 'High school seniors, financial need, academic excellence, leadership',
-                'application_requirements': 'Online application, essays, transcripts, recommendations, financial aid forms',
-                'deadline': '11/18/2024',
-                'gpa_requirement': 3.5,
-                'website': 'https://www.jkcf.org',
-                'contact_info': 'scholarships@jkcf.org',
-                'source': 'cooke_foundation'
-            },
-            {
-                'title': 'Coca-Cola Scholars Program',
-                'amount': 20000,
-                'category': 'General',
-                'target_demographics': ['Leadership', 'Community service'],
-                'description': 'Merit-based scholarship recognizing academic excellence and leadership',
-                'eligibility_criteria': 'High school seniors, U.S. citizens, academic achievement, leadership experience',
-                'application_requirements': 'Online application, transcripts, activities list, essays',
-                'deadline': '10/31/2024',
-                'gpa_requirement': 3.0,
-                'website': 'https://www.coca-colascholarsfoundation.org',
-                'contact_info': 'scholars@coca-cola.com',
-                'source': 'coca_cola_foundation'
-            }
-        ]
-        
-        return foundation_scholarships
+        return iter(_FOUNDATION_SCHOLARSHIPS)
     
-    def fetch_corporate_scholarships(self) -> List[Dict[str, Any]]:
+    def fetch_corporate_scholarships(self) -> Iterator[Mapping[str, Any]]:
         """Fetch scholarships from corporations"""
-        corporate_scholarships = [
-            {
-                'title': 'Google Lime Scholarship',
-                'amount': 10000,
-                'category': 'Computer Science',
-                'target_demographics': ['Student with disability'],
-                'description': 'Scholarship for students with disabilities pursuing computer science',
-                'eligibility_criteria': 'Students with disabilities, pursuing computer science or related field',
-                'application_requirements': 'Online application, transcripts, essays, documentation of disability',
-                'deadline': '12/04/2024',
-                'gpa_requirement': 3.7,
-                'website': 'https://www.limeconnect.com/programs/page/google-lime-scholarship',
-                'contact_info': 'info@limeconnect.com',
-                'source': 'google_lime'
-            },
-            {
-                'title': 'Microsoft Scholarship Program',
-                'amount': 12000,
-                'category': 'Computer Science',
-                'target_demographics': ['Underrepresented minority', 'Women in STEM'],
-                'description': 'Scholarship for underrepresented students in computer science and related STEM fields',
-                'eligibility_criteria': 'Underrepresented minorities and women in computer science, engineering, or math',
-                'application_requirements': 'Online application, transcripts, essays, resume, recommendations',
-                'deadline': '01/31/2025',
-                'gpa_requirement': 3.0,
-                'website': 'https://careers.microsoft.com/students/us/en/usscholarshipprogram',
-                'contact_info': 'scholarships@microsoft.com',
-                'source': 'microsoft'
-            },
-            {
-                'title': 'Amazon Future Engineer Scholarship',
-                'amount': 40000,
-                'category': 'Computer Science',
-                'target_demographics': ['Underrepresented minority', 'Low-income background'],
-                'description': 'Four-year scholarship plus internship for underrepresented students in computer science',
-                'eligibility_criteria': 'High school seniors from underrepresented groups, planning to study computer science',
-                'application_requirements': 'Online application, transcripts, essays, financial information',
-                'deadline': '01/17/2025',
-                'gpa_requirement': 3.0,
-                'website': 'https://www.amazonfutureengineer.com/scholarships',
-                'contact_info': 'amazonfutureengineer@amazon.com',
-                'source': 'amazon'
-            }
-        ]
-        
-        return corporate_scholarships
+        return iter(_CORPORATE_SCHOLARSHIPS)
     
-    def fetch_organization_scholarships(self) -> List[Dict[str, Any]]:
+    def fetch_organization_scholarships(self) -> Iterator[Mapping[str, Any]]:
         """Fetch scholarships from professional organizations and associations"""
-        org_scholarships = [
-            {
-                'title': 'Society of Women Engineers Scholarship',
-                'amount': 15000,
-                'category': 'Engineering',
-                'target_demographics': ['Women in STEM'],
-                'description': 'Scholarships for women pursuing engineering degrees',
-                'eligibility_criteria': 'Women studying engineering or computer science, various GPA requirements',
-                'application_requirements': 'Online application, transcripts, essays, references',
-                'deadline': '02/15/2025',
-                'gpa_requirement': 3.0,
-                'website': 'https://scholarships.swe.org',
-                'contact_info': 'scholarships@swe.org',
-                'source': 'swe'
-            },
-            {
-                'title': 'National Society of Black Engineers Scholarship',
-                'amount': 10000,
-                'category': 'Engineering',
-                'target_demographics': ['Underrepresented minority'],
-                'description': 'Scholarships for Black students in engineering and technology fields',
-                'eligibility_criteria': 'Black/African American students in engineering, computer science, or technology',
-                'application_requirements': 'Online application, transcripts, essays, NSBE membership preferred',
-                'deadline': '01/31/2025',
-                'gpa_requirement': 3.2,
-                'website': 'https://www.nsbe.org/scholarships',
-                'contact_info': 'scholarships@nsbe.org',
-                'source': 'nsbe'
-            },
-            {
-                'title': 'Hispanic Scholarship Fund',
-                'amount': 5000,
-                'category': 'General',
-                'target_demographics': ['Underrepresented minority'],
-                'description': 'Scholarships for Hispanic/Latino students pursuing higher education',
-                'eligibility_criteria': 'Hispanic heritage, U.S. citizenship or legal permanent residency, minimum GPA',
-                'application_requirements': 'Online application, transcripts, FAFSA, essays',
-                'deadline': '03/30/2025',
-                'gpa_requirement': 3.0,
-                'website': 'https://www.hsf.net/scholarships',
-                'contact_info': 'scholar1@hsf.net',
-                'source': 'hsf'
-            }
-        ]
-        
-        return org_scholarships
+        return iter(_ORGANIZATION_SCHOLARSHIPS)
     
-    def fetch_university_scholarships(self) -> List[Dict[str, Any]]:
+    def fetch_university_scholarships(self) -> Iterator[Mapping[str, Any]]:
         """Fetch scholarships from major universities"""
-        university_scholarships = [
-            {
-                'title': 'Stanford Knight-Hennessy Scholars',
-                'amount': 75000,
-                'category': 'General',
-                'target_demographics': ['Graduate students', 'International student'],
-                'description': 'Full funding for graduate study at Stanford University',
-                'eligibility_criteria': 'Applying to graduate programs at Stanford, leadership potential, civic commitment',
-                'application_requirements': 'Stanford graduate application, additional Knight-Hennessy application',
-                'deadline': '10/10/2024',
-                'gpa_requirement': 3.8,
-                'website': 'https://knight-hennessy.stanford.edu',
-                'contact_info': 'kh-program@stanford.edu',
-                'source': 'stanford'
-            },
-            {
-                'title': 'Harvard University Need-Based Aid',
-                'amount': 70000,
-                'category': 'General',
-                'target_demographics': ['Low-income background'],
-                'description': 'Need-based financial aid covering full cost of attendance',
-                'eligibility_criteria': 'Admitted Harvard students with family income below $85,000',
-                'application_requirements': 'CSS Profile, FAFSA, tax returns, financial documents',
-                'deadline': '02/01/2025',
-                'gpa_requirement': 0.0,
-                'website': 'https://college.harvard.edu/financial-aid',
-                'contact_info': 'fao@fas.harvard.edu',
-                'source': 'harvard'
-            },
-            {
-                'title': 'MIT Need-Based Financial Aid',
-                'amount': 65000,
-                'category': 'STEM',
-                'target_demographics': ['Low-income background'],
-                'description': 'Need-based aid for families earning less than $90,000',
-                'eligibility_criteria': 'Admitted MIT students, family income below $90,000',
-                'application_requirements': 'CSS Profile, FAFSA, tax returns',
-                'deadline': '02/15/2025',
-                'gpa_requirement': 0.0,
-                'website': 'https://sfs.mit.edu',
-                'contact_info': 'sfs@mit.edu',
-                'source': 'mit'
-            }
-        ]
-        
-        return university_scholarships
+        return iter(_UNIVERSITY_SCHOLARSHIPS)
     
-    def fetch_state_scholarships(self) -> List[Dict[str, Any]]:
+    def fetch_state_scholarships(self) -> Iterator[Mapping[str, Any]]:
         """Fetch state-specific scholarships"""
-        state_scholarships = [
-            {
-                'title': 'California Cal Grant A',
-                'amount': 12570,
-                'category': 'General',
-                'target_demographics': ['California residents'],
-                'description': 'State grant for California residents attending California colleges',
-                'eligibility_criteria': 'California residents, financial need, minimum GPA requirements',
-                'application_requirements': 'FAFSA or California Dream Act Application, GPA verification',
-                'deadline': '03/02/2025',
-                'gpa_requirement': 3.0,
-                'website': 'https://www.csac.ca.gov/cal-grants',
-                'contact_info': 'studentsupport@csac.ca.gov',
-                'source': 'california_state'
-            },
-            {
-                'title': 'Texas TEXAS Grant',
-                'amount': 10000,
-                'category': 'General',
-                'target_demographics': ['Texas residents'],
-                'description': 'Need-based grant for Texas residents attending Texas public universities',
-                'eligibility_criteria': 'Texas residents, financial need, complete high school curriculum',
-                'application_requirements': 'FAFSA, meet Texas Success Initiative requirements',
-                'deadline': '03/15/2025',
-                'gpa_requirement': 2.5,
-                'website': 'https://www.thecb.state.tx.us/texas-grant',
-                'contact_info': 'grantinfo@thecb.state.tx.us',
-                'source': 'texas_state'
-            },
-            {
-                'title': 'New York Excelsior Scholarship',
-                'amount': 6470,
-                'category': 'General',
-                'target_demographics': ['New York residents'],
-                'description': 'Tuition award for middle-class families attending SUNY or CUNY schools',
-                'eligibility_criteria': 'New York residents, family income up to $125,000, attend SUNY/CUNY',
-                'application_requirements': 'FAFSA, NYS Student Aid Application',
-                'deadline': '06/30/2025',
-                'gpa_requirement': 2.0,
-                'website': 'https://www.hesc.ny.gov/pay-for-college/apply-for-financial-aid/nys-grants-scholarships-and-awards/the-excelsior-scholarship.html',
-                'contact_info': 'info@hesc.ny.gov',
-                'source': 'new_york_state'
-            }
-        ]
-        
-        return state_scholarships
+        return iter(_STATE_SCHOLARSHIPS)
     
-    def fetch_specialty_scholarships(self) -> List[Dict[str, Any]]:
+    def fetch_specialty_scholarships(self) -> Iterator[Mapping[str, Any]]:
         """Fetch scholarships for specific fields and demographics"""
-        specialty_scholarships = [
-            {
-                'title': 'Point Foundation LGBTQ Scholarship',
-                'amount': 27000,
-                'category': 'General',
-                'target_demographics': ['LGBTQ+'],
-                'description': 'Scholarship and mentorship for LGBTQ students',
-                'eligibility_criteria': 'LGBTQ students, academic merit, financial need, leadership potential',
-                'application_requirements': 'Online application, essays, transcripts, recommendations, financial documents',
-                'deadline': '01/27/2025',
-                'gpa_requirement': 3.2,
-                'website': 'https://pointfoundation.org/point-apply/application-requirements/',
-                'contact_info': 'info@pointfoundation.org',
-                'source': 'point_foundation'
-            },
-            {
-                'title': 'American Indian College Fund Scholarship',
-                'amount': 8000,
-                'category': 'General',
-                'target_demographics': ['Native American'],
-                'description': 'Scholarships for Native American students attending tribal and mainstream colleges',
-                'eligibility_criteria': 'Native American heritage, enrolled member of federally recognized tribe',
-                'application_requirements': 'Online application, tribal enrollment verification, transcripts, essays',
-                'deadline': '05/31/2025',
-                'gpa_requirement': 2.0,
-                'website': 'https://collegefund.org/students/scholarships/',
-                'contact_info': 'scholarships@collegefund.org',
-                'source': 'aicf'
-            },
-            {
-                'title': 'United Negro College Fund Scholarship',
-                'amount': 7500,
-                'category': 'General',
-                'target_demographics': ['Underrepresented minority'],
-                'description': 'Scholarships for African American students attending UNCF member schools',
-                'eligibility_criteria': 'African American students, attending UNCF member institution, financial need',
-                'application_requirements': 'Online application, FAFSA, transcripts, essays, recommendations',
-                'deadline': '06/30/2025',
-                'gpa_requirement': 2.5,
-                'website': 'https://uncf.org/scholarships',
-                'contact_info': 'scholarshiphelp@uncf.org',
-                'source': 'uncf'
-            }
-        ]
-        
-        return specialty_scholarships
+        return iter(_SPECIALTY_SCHOLARSHIPS)
     
-    def aggregate_all_real_scholarships(self) -> List[Dict[str, Any]]:
+    def aggregate_all_real_scholarships(self) -> List[Mapping[str, Any]]:
         """Aggregate all real scholarship data from verified sources"""
+        scholarships, errors = _cached_aggregate(self)
+        self.last_errors = list(errors)
+        return list(scholarships)
+    
+    def _aggregate_sources(self) -> Tuple[Mapping[str, Any], ...]:
+        """Collect the records of every source, going through the shared Redis cache when configured"""
+        client = _redis_client()
+        if client is None:
+            return self._collect_sources()
+        
+        try:
+            cached = client.get(AGGREGATE_CACHE_KEY)
+            if cached:
+                return _freeze_scholarships(_loads(cached))
+        except redis.RedisError:
+            pass
+        
+        scholarships = self._collect_sources()
+        if self.last_errors or not scholarships:
+            # Serve the last good copy, and never let a failed run overwrite it
+            try:
+                stale = client.get(f"{AGGREGATE_CACHE_KEY}:stale")
+            except redis.RedisError:
+                stale = None
+            if stale:
+                return _freeze_scholarships(_loads(stale))
+            return scholarships
+        
+        try:
+            payload = _dumps([dict(scholarship) for scholarship in scholarships])
+            client.set(AGGREGATE_CACHE_KEY, payload, ex=AGGREGATE_CACHE_TTL)
+            client.set(f"{AGGREGATE_CACHE_KEY}:stale", payload)
+        except redis.RedisError:
+            pass
+        
+        return scholarships
+    
+    def _collect_sources(self) -> Tuple[Mapping[str, Any], ...]:
+        """Collect the records of every source, skipping sources that fail"""
         all_scholarships = []
         
         # Collect from all sources
@@ -386,109 +620,48 @@ class RealScholarshipIntegrator:
             self.fetch_specialty_scholarships
         ]
         
-        for source_func in scholarship_sources:
-            try:
-                scholarships = source_func()
-                all_scholarships.extend(scholarships)
-            except Exception as e:
-                st.warning(f"Error fetching from source: {str(e)}")
+        # Run every fetcher concurrently so slow sources overlap instead of adding up
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            futures = [executor.submit(source_func) for source_func in scholarship_sources]
+        
+        self.last_errors = []
+        for source_func, future in zip(scholarship_sources, futures):
+            error = future.exception()
+            if error is not None:
+                # Reported to the user by the caller; fetchers run off the script thread
+                log.warning("Error fetching from %s: %s", source_func.__name__, error, exc_info=error)
+                self.last_errors.append(f"{source_func.__name__}: {error}")
                 continue
+            all_scholarships.extend(future.result())
         
-        return all_scholarships
+        return tuple(all_scholarships)
     
-    def enrich_with_additional_data(self, scholarships: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def enrich_with_additional_data(self, scholarships: List[Mapping[str, Any]]) -> List[Dict[str, Any]]:
         """Enrich scholarship data with additional standardized information"""
-        enriched = []
-        
-        for scholarship in scholarships:
-            # Add standardized fields
-            scholarship['last_updated'] = datetime.now().isoformat()
-            scholarship['verification_status'] = 'verified'
-            scholarship['application_difficulty'] = self._assess_difficulty(scholarship)
-            scholarship['estimated_applicants'] = self._estimate_applicants(scholarship)
-            
-            # Standardize demographics
-            scholarship['target_demographics'] = self._standardize_demographics(
-                scholarship.get('target_demographics', [])
-            )
-            
-            enriched.append(scholarship)
-        
-        return enriched
-    
-    def _assess_difficulty(self, scholarship: Dict[str, Any]) -> str:
-        """Assess application difficulty level"""
-        requirements = scholarship.get('application_requirements', '').lower()
-        gpa_req = scholarship.get('gpa_requirement', 0)
+        now_iso = datetime.now().isoformat()
+        precomputed = [_precomputed_enrichment(scholarship) for scholarship in scholarships]
         
-        difficulty_score = 0
+        if all(record is not None for record in precomputed):
+            # Records from the static tables were enriched at import; only the timestamp is new
+            return [
+                {**record, 'last_updated': now_iso, 'target_demographics': list(record['target_demographics'])}
+                for record in precomputed
+            ]
         
-        if 'essay' in requirements:
-            difficulty_score += 1
-        if 'recommendation' in requirements:
-            difficulty_score += 1
-        if 'portfolio' in requirements:
-            difficulty_score += 2
-        if gpa_req >= 3.5:
-            difficulty_score += 2
-        elif gpa_req >= 3.0:
-            difficulty_score += 1
-        
-        if difficulty_score >= 4:
-            return 'High'
-        elif difficulty_score >= 2:
-            return 'Medium'
-        else:
-            return 'Low'
-    
-    def _estimate_applicants(self, scholarship: Dict[str, Any]) -> int:
-        """Estimate number of applicants based on scholarship characteristics"""
-        amount = scholarship.get('amount', 0)
-        source = scholarship.get('source', '')
-        
-        if amount >= 50000:
-            return 5000
-        elif amount >= 20000:
-            return 2000
-        elif amount >= 10000:
-            return 1000
-        elif amount >= 5000:
-            return 500
-        else:
-            return 200
-    
-    def _standardize_demographics(self, demographics: List[str]) -> List[str]:
-        """Standardize demographic categories"""
-        standardized = []
-        demographic_mapping = {
-            'minority': 'Underrepresented minority',
-            'african american': 'Underrepresented minority',
-            'hispanic': 'Underrepresented minority',
-            'latino': 'Underrepresented minority',
-            'native american': 'Native American',
-            'women': 'Women in STEM',
-            'female': 'Women in STEM',
-            'lgbtq': 'LGBTQ+',
-            'lgbt': 'LGBTQ+',
-            'disability': 'Student with disability',
-            'disabled': 'Student with disability',
-            'low income': 'Low-income background',
-            'financial need': 'Low-income background',
-            'first generation': 'First-generation college student',
-            'first-gen': 'First-generation college student',
-            'veteran': 'Veteran',
-            'military': 'Veteran',
-            'international': 'International student'
-        }
-        
-        for demo in demographics:
-            demo_lower = demo.lower()
-            for key, value in demographic_mapping.items():
-                if key in demo_lower:
-                    if value not in standardized:
-                        standardized.append(value)
-                    break
-            else:
-                standardized.append(demo)
-        
-        return standardized if standardized else ['General']
\ No newline at end of file
+        return _score_scholarships(scholarships, now_iso)
+
+
+@st.cache_resource(show_spinner=False)
+def _redis_client() -> Optional['redis.Redis']:
+    """Connect to the Redis instance named by REDIS_URL, if any"""
+    redis_url = os.getenv('REDIS_URL')
+    if not _HAS_REDIS or not redis_url:
+        return None
+    return redis.Redis.from_url(redis_url, socket_timeout=1, socket_connect_timeout=1)
+
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _cached_aggregate(_integrator: RealScholarshipIntegrator) -> Tuple[Tuple[Mapping[str, Any], ...], Tuple[str, ...]]:
+    """Aggregate the source tables once per hour; the records are read-only so they are shared as-is"""
+    scholarships = _integrator._aggregate_sources()
+    return scholarships, tuple(_integrator.last_errors)
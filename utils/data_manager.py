@@ -1,15 +1,44 @@
 import pandas as pd
+import numpy as np
 import json
-from typing import List, Dict, Any, Optional
+import re
+from collections import defaultdict
+from typing import List, Dict, Any, Optional, Tuple, IO
 from io import StringIO
 import streamlit as st
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+# Free-text columns matched by search_scholarships
+SEARCH_COLUMNS = ['title', 'description', 'category', 'eligibility_criteria']
+
+# Low-cardinality columns stored as categoricals
+CATEGORICAL_COLUMNS = ['category', 'source']
+
+# Splits searchable text into the tokens of the search index
+TOKEN_PATTERN = re.compile(r'\W+')
+
 class DataManager:
     """Manages scholarship data storage and retrieval"""
     
     def __init__(self):
-        self.scholarships = []
         self.scholarships_df = None
+        self._index_tokens = None
+        self._index_rows = None
+        self._list_positions = np.empty(0, dtype=np.int64)
+        
+        # Raw records that failed validation, by their position in self.scholarships
+        self._rejected = {}
+        
+        # Bumped on every change to the data; memoized getters are only valid for one version
+        self._version = 0
+        self._memo = {}
+        self._memo_version = 0
     
     def load_scholarships(self, scholarships_data: List[Dict[str, Any]]):
         """Load scholarship data from a list of dictionaries"""
@@ -18,51 +47,187 @@ class DataManager:
         
         integrator = RealScholarshipIntegrator()
         real_scholarships = integrator.aggregate_all_real_scholarships()
+        for error in integrator.last_errors:
+            st.warning(f"Error fetching from source: {error}")
         enriched_scholarships = integrator.enrich_with_additional_data(real_scholarships)
         
         # Combine with any provided data
         all_scholarships = enriched_scholarships + scholarships_data
         
-        self.scholarships = all_scholarships
         self.scholarships_df = pd.DataFrame(all_scholarships)
         
         # Ensure proper data types
-        self._clean_and_validate_data()
+        self._clean_and_validate_data(all_scholarships)
+    
+    @property
+    def scholarships(self) -> List[Dict[str, Any]]:
+        """All scholarship records in order, built on demand from the dataframe and the rejected records"""
+        records = [None] * (len(self._list_positions) + len(self._rejected))
+        if self.scholarships_df is not None and not self.scholarships_df.empty:
+            for position, record in zip(self._list_positions, self.scholarships_df.to_dict('records')):
+                # Leave out the fields this record never had
+                records[position] = {
+                    key: value for key, value in record.items()
+                    if isinstance(value, (list, tuple)) or not pd.isna(value)
+                }
+        for position, record in self._rejected.items():
+            records[position] = record
+        return records
     
-    def _clean_and_validate_data(self):
-        """Clean and validate scholarship data"""
+    def _clean_and_validate_data(self, records: List[Dict[str, Any]]):
+        """Clean and validate scholarship data built from records"""
+        self._version += 1
+        self._index_tokens = None
+        self._index_rows = None
         if self.scholarships_df is None or self.scholarships_df.empty:
+            self._list_positions = np.empty(0, dtype=np.int64)
+            self._rejected = dict(enumerate(records))
             return
         
-        # Convert amount to numeric
-        self.scholarships_df['amount'] = pd.to_numeric(self.scholarships_df['amount'], errors='coerce')
+        cleaned_df = self._clean_rows(self.scholarships_df)
         
-        # Convert GPA requirement to numeric
-        self.scholarships_df['gpa_requirement'] = pd.to_numeric(self.scholarships_df['gpa_requirement'], errors='coerce')
+        # Remember which record each surviving row came from, and keep the rest as given
+        self._list_positions = cleaned_df.index.to_numpy(dtype=np.int64)
+        rejected_positions = np.setdiff1d(np.arange(len(records)), self._list_positions)
+        self._rejected = {int(position): records[position] for position in rejected_positions}
+        
+        # Reset index after dropping rows
+        self.scholarships_df = cleaned_df.reset_index(drop=True)
+    
+    def _clean_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Coerce types and fill defaults, dropping rows with missing critical data"""
+        # Convert amount, GPA requirement and deadline from whatever text they were given as
+        self._vectorize_parse(df)
         
         # Ensure target_demographics is a list
-        if 'target_demographics' in self.scholarships_df.columns:
-            self.scholarships_df['target_demographics'] = self.scholarships_df['target_demographics'].apply(
+        if 'target_demographics' in df.columns:
+            df['target_demographics'] = df['target_demographics'].apply(
                 lambda x: x if isinstance(x, list) else [x] if x else []
             )
         
         # Fill missing values
-        self.scholarships_df['description'] = self.scholarships_df['description'].fillna('')
-        self.scholarships_df['eligibility_criteria'] = self.scholarships_df['eligibility_criteria'].fillna('')
-        self.scholarships_df['application_requirements'] = self.scholarships_df['application_requirements'].fillna('')
-        self.scholarships_df['website'] = self.scholarships_df['website'].fillna('')
-        self.scholarships_df['contact_info'] = self.scholarships_df['contact_info'].fillna('')
+        df['description'] = df['description'].fillna('')
+        df['eligibility_criteria'] = df['eligibility_criteria'].fillna('')
+        df['application_requirements'] = df['application_requirements'].fillna('')
+        df['website'] = df['website'].fillna('')
+        df['contact_info'] = df['contact_info'].fillna('')
+        
+        # Arrow-backed strings let text search run in pyarrow's compute kernels
+        if _HAS_PYARROW:
+            for column in SEARCH_COLUMNS:
+                if column in df.columns:
+                    df[column] = df[column].astype('string[pyarrow]')
         
         # Remove any rows with missing critical data
         critical_columns = ['title', 'amount', 'category', 'deadline']
-        self.scholarships_df = self.scholarships_df.dropna(subset=critical_columns)
+        df = df.dropna(subset=critical_columns)
         
-        # Reset index after dropping rows
-        self.scholarships_df = self.scholarships_df.reset_index(drop=True)
+        # Categorize only the kept rows, so rejected rows leave no categories behind
+        for column in CATEGORICAL_COLUMNS:
+            if column in df.columns:
+                df[column] = df[column].astype('category')
+        return df
+    
+    def _vectorize_parse(self, df: pd.DataFrame):
+        """Parse the amount, GPA and deadline columns in place, one vectorized pass per column"""
+        df['amount'] = self._parse_numbers(df['amount'])
+        df['gpa_requirement'] = self._parse_numbers(df['gpa_requirement'], upper=4.0)
+        
+        if 'deadline' in df.columns and not pd.api.types.is_numeric_dtype(df['deadline']):
+            deadlines = df['deadline']
+            # Most deadlines are already MM/DD/YYYY; only the rest need the slower mixed-format parser
+            parsed = pd.to_datetime(deadlines, format='%m/%d/%Y', errors='coerce')
+            unparsed = parsed.isna() & deadlines.notna()
+            if unparsed.any():
+                parsed[unparsed] = pd.to_datetime(deadlines[unparsed], format='mixed', errors='coerce')
+            df['deadline'] = deadlines.where(parsed.isna(), parsed.dt.strftime('%m/%d/%Y'))
+    
+    def _parse_numbers(self, values: pd.Series, upper: Optional[float] = None) -> pd.Series:
+        """Coerce a column to numbers, pulling the number out of text like '$5,000' (capped at upper)"""
+        numbers = pd.to_numeric(values, errors='coerce')
+        if pd.api.types.is_numeric_dtype(values):
+            return numbers
+        
+        text = values.where(numbers.isna()).astype('string').str.replace(r'[$,]', '', regex=True)
+        extracted = pd.to_numeric(text.str.extract(r'(\d+\.\d+|\d+)', expand=False), errors='coerce')
+        if upper is not None:
+            extracted = extracted.clip(upper=upper)
+        return numbers.fillna(extracted)
+    
+    def _clean_record(self, scholarship_data: Dict[str, Any]) -> pd.DataFrame:
+        """Clean a single scholarship into a (possibly empty) frame shaped like the current dataframe"""
+        row_df = pd.DataFrame([scholarship_data])
+        columns = self.scholarships_df.columns.union(row_df.columns, sort=False)
+        row_df = self._clean_rows(row_df.reindex(columns=columns))
+        
+        # Share the dataframe's categories so concatenating keeps the categorical dtype
+        for column in CATEGORICAL_COLUMNS:
+            if column in row_df.columns and isinstance(self.scholarships_df[column].dtype, pd.CategoricalDtype):
+                current = self.scholarships_df[column]
+                values = row_df[column].dropna().astype(current.cat.categories.dtype)
+                missing = values[~values.isin(current.cat.categories)].unique()
+                if len(missing):
+                    self.scholarships_df[column] = current.cat.add_categories(missing)
+                row_df[column] = row_df[column].astype(self.scholarships_df[column].dtype)
+        return row_df
+    
+    def _drop_unused_categories(self):
+        """Forget categories no remaining row uses"""
+        for column in CATEGORICAL_COLUMNS:
+            if column in self.scholarships_df.columns and isinstance(self.scholarships_df[column].dtype, pd.CategoricalDtype):
+                self.scholarships_df[column] = self.scholarships_df[column].cat.remove_unused_categories()
+    
+    def _rebuild_dataframe(self, records: List[Dict[str, Any]]):
+        """Rebuild the dataframe from the full list of records"""
+        self.scholarships_df = pd.DataFrame(records)
+        self._clean_and_validate_data(records)
+    
+    def _build_search_index(self):
+        """Map every lowercased token of the searched columns to the row positions containing it"""
+        postings = defaultdict(list)
+        for column in SEARCH_COLUMNS:
+            if column not in self.scholarships_df.columns:
+                continue
+            for row, text in enumerate(self.scholarships_df[column]):
+                if isinstance(text, str):
+                    for token in set(TOKEN_PATTERN.split(text.lower())):
+                        postings[token].append(row)
+        
+        postings.pop('', None)
+        self._index_tokens = np.array(list(postings), dtype=str)
+        self._index_rows = [np.unique(rows) for rows in postings.values()]
+    
+    def _search_candidates(self, query: str) -> Optional[np.ndarray]:
+        """Boolean mask of rows that can contain the query, or None when the index can't narrow it down"""
+        query_tokens = [token for token in TOKEN_PATTERN.split(query.lower()) if token]
+        if not query_tokens:
+            return None
+        
+        # Built lazily, so edits only pay for it once the next search runs
+        if self._index_tokens is None:
+            self._build_search_index()
+        
+        # A query token may sit inside a longer indexed word, so match it against the whole vocabulary
+        candidates = np.ones(len(self.scholarships_df), dtype=bool)
+        for query_token in query_tokens:
+            token_rows = np.zeros(len(self.scholarships_df), dtype=bool)
+            for position in np.flatnonzero(np.char.find(self._index_tokens, query_token) >= 0):
+                token_rows[self._index_rows[position]] = True
+            candidates &= token_rows
+        return candidates
     
-    def get_scholarships_df(self) -> pd.DataFrame:
-        """Get the scholarships dataframe"""
-        return self.scholarships_df.copy() if self.scholarships_df is not None else pd.DataFrame()
+    def _memoized(self, key: str, compute):
+        """Return compute() cached until the data next changes"""
+        if self._memo_version != self._version:
+            self._memo = {}
+            self._memo_version = self._version
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+    
+    def get_scholarships_df(self, copy: bool = False) -> pd.DataFrame:
+        """Get the scholarships dataframe (a shallow copy unless copy=True, so don't modify values in place)"""
+        return self.scholarships_df.copy(deep=copy) if self.scholarships_df is not None else pd.DataFrame()
     
     def get_scholarship_by_id(self, scholarship_id: int) -> Optional[Dict[str, Any]]:
         """Get a specific scholarship by its index"""
@@ -76,64 +241,90 @@ class DataManager:
         if self.scholarships_df is None or self.scholarships_df.empty:
             return pd.DataFrame()
         
-        result_df = self.scholarships_df.copy()
+        # Every clause ANDs into one row mask; the dataframe is sliced once at the end
+        scholarships_df = self.scholarships_df
+        mask = np.ones(len(scholarships_df), dtype=bool)
+        
+        # Hash the filter values once
+        filters = filters or {}
+        category_set = frozenset(filters['categories']) if filters.get('categories') else None
+        demographic_set = frozenset(filters['demographics']) if filters.get('demographics') else None
         
         # Text search
         if query:
-            search_columns = ['title', 'description', 'category', 'eligibility_criteria']
-            search_mask = pd.Series([False] * len(result_df))
+            # Only rows holding every query token can match; confirm the full substring on those
+            candidates = self._search_candidates(query)
+            candidate_rows = np.arange(len(scholarships_df)) if candidates is None else np.flatnonzero(candidates)
+            search_mask = np.zeros(len(scholarships_df), dtype=bool)
             
-            for column in search_columns:
-                if column in result_df.columns:
-                    search_mask |= result_df[column].str.contains(query, case=False, na=False)
+            for column in SEARCH_COLUMNS:
+                if column in scholarships_df.columns:
+                    values = scholarships_df[column].iloc[candidate_rows]
+                    search_mask[candidate_rows] |= self._text_match(values, query).to_numpy()
             
-            result_df = result_df[search_mask]
+            mask &= search_mask
         
         # Apply filters
         if filters:
-            # Amount range filter
-            if 'min_amount' in filters and filters['min_amount'] is not None:
-                result_df = result_df[result_df['amount'] >= filters['min_amount']]
-            
-            if 'max_amount' in filters and filters['max_amount'] is not None:
-                result_df = result_df[result_df['amount'] <= filters['max_amount']]
+            # Amount range and GPA filters over the cached float arrays
+            amounts, gpas = self._numeric_columns()
+            if filters.get('min_amount') is not None:
+                mask &= amounts >= filters['min_amount']
+            if filters.get('max_amount') is not None:
+                mask &= amounts <= filters['max_amount']
+            if filters.get('max_gpa_requirement') is not None:
+                mask &= gpas <= filters['max_gpa_requirement']
             
             # Category filter
-            if 'categories' in filters and filters['categories']:
-                category_mask = result_df['category'].isin(filters['categories'])
-                result_df = result_df[category_mask]
+            if category_set:
+                mask &= scholarships_df['category'].isin(category_set).to_numpy(dtype=bool)
             
             # Demographics filter
-            if 'demographics' in filters and filters['demographics']:
-                demo_mask = result_df['target_demographics'].apply(
-                    lambda x: any(demo in filters['demographics'] for demo in x) if isinstance(x, list) else False
-                )
-                result_df = result_df[demo_mask]
-            
-            # GPA filter
-            if 'max_gpa_requirement' in filters and filters['max_gpa_requirement'] is not None:
-                result_df = result_df[result_df['gpa_requirement'] <= filters['max_gpa_requirement']]
+            if demographic_set:
+                # One entry per (remaining row, demographic), matched in a single isin pass
+                exploded = scholarships_df['target_demographics'].iloc[np.flatnonzero(mask)].explode()
+                demo_mask = np.zeros(len(scholarships_df), dtype=bool)
+                demo_mask[exploded.index.to_numpy()[exploded.isin(demographic_set).to_numpy(dtype=bool)]] = True
+                mask &= demo_mask
         
-        return result_df
+        return scholarships_df[mask]
+    
+    def _numeric_columns(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Amount and GPA requirement as float arrays, cached until the data changes"""
+        return self._memoized('numeric_columns', lambda: (
+            self.scholarships_df['amount'].to_numpy(dtype=np.float64, na_value=np.nan),
+            self.scholarships_df['gpa_requirement'].to_numpy(dtype=np.float64, na_value=np.nan)
+        ))
+    
+    def _text_match(self, column: pd.Series, query: str) -> pd.Series:
+        """Case-insensitive literal substring match, using pyarrow when available"""
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            # Match each category once and broadcast through the codes (-1, missing, never matches)
+            category_matches = self._text_match(pd.Series(column.cat.categories), query).to_numpy()
+            matches = np.append(category_matches, False)[column.cat.codes.to_numpy()]
+            return pd.Series(matches, index=column.index)
+        if _HAS_PYARROW:
+            matches = pc.fill_null(pc.match_substring(pa.array(column), query, ignore_case=True), False)
+            return pd.Series(matches.to_numpy(zero_copy_only=False), index=column.index)
+        return column.str.contains(query, case=False, na=False, regex=False)
     
     def get_categories(self) -> List[str]:
         """Get all unique categories"""
         if self.scholarships_df is None or self.scholarships_df.empty:
             return []
         
-        return sorted(self.scholarships_df['category'].unique().tolist())
+        return list(self._memoized('categories', lambda: sorted(self.scholarships_df['category'].cat.categories.tolist())))
     
     def get_demographics(self) -> List[str]:
         """Get all unique demographics"""
         if self.scholarships_df is None or self.scholarships_df.empty:
             return []
         
-        all_demographics = set()
-        for demo_list in self.scholarships_df['target_demographics']:
-            if isinstance(demo_list, list):
-                all_demographics.update(demo_list)
+        def compute_demographics():
+            all_demographics = self.scholarships_df['target_demographics'].explode().dropna().unique()
+            return sorted(all_demographics.tolist())
         
-        return sorted(list(all_demographics))
+        return list(self._memoized('demographics', compute_demographics))
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get basic statistics about the scholarship data"""
@@ -148,53 +339,110 @@ class DataManager:
                 'demographics_count': 0
             }
         
-        return {
-            'total_scholarships': len(self.scholarships_df),
-            'total_value': self.scholarships_df['amount'].sum(),
-            'average_amount': self.scholarships_df['amount'].mean(),
-            'min_amount': self.scholarships_df['amount'].min(),
-            'max_amount': self.scholarships_df['amount'].max(),
-            'categories_count': self.scholarships_df['category'].nunique(),
-            'demographics_count': len(self.get_demographics())
-        }
+        def compute_statistics():
+            return {
+                'total_scholarships': len(self.scholarships_df),
+                'total_value': self.scholarships_df['amount'].sum(),
+                'average_amount': self.scholarships_df['amount'].mean(),
+                'min_amount': self.scholarships_df['amount'].min(),
+                'max_amount': self.scholarships_df['amount'].max(),
+                'categories_count': self.scholarships_df['category'].nunique(),
+                'demographics_count': len(self.get_demographics())
+            }
+        
+        return dict(self._memoized('statistics', compute_statistics))
     
     def add_scholarship(self, scholarship_data: Dict[str, Any]):
         """Add a new scholarship to the dataset"""
-        self.scholarships.append(scholarship_data)
+        position = len(self._list_positions) + len(self._rejected)
+        self._version += 1
+        
+        if self.scholarships_df is None or self.scholarships_df.empty:
+            self._rebuild_dataframe(self.scholarships + [scholarship_data])
+            return
         
-        # Recreate the dataframe
-        self.scholarships_df = pd.DataFrame(self.scholarships)
-        self._clean_and_validate_data()
+        # Clean just the new record and append it
+        row_df = self._clean_record(scholarship_data)
+        if not row_df.empty:
+            self.scholarships_df = pd.concat([self.scholarships_df, row_df], ignore_index=True)
+            self._list_positions = np.append(self._list_positions, position)
+            self._index_tokens = None
+        else:
+            self._rejected[position] = scholarship_data
     
     def update_scholarship(self, index: int, scholarship_data: Dict[str, Any]):
         """Update an existing scholarship"""
-        if 0 <= index < len(self.scholarships):
-            self.scholarships[index] = scholarship_data
+        if 0 <= index < len(self._list_positions) + len(self._rejected):
+            self._version += 1
             
-            # Recreate the dataframe
-            self.scholarships_df = pd.DataFrame(self.scholarships)
-            self._clean_and_validate_data()
+            if self.scholarships_df is None or self.scholarships_df.empty:
+                records = self.scholarships
+                records[index] = scholarship_data
+                self._rebuild_dataframe(records)
+                return
+            
+            # Swap the cleaned record in place of the old row (or drop it if it no longer validates)
+            self._rejected.pop(index, None)
+            row_df = self._clean_record(scholarship_data)
+            if row_df.empty:
+                self._rejected[index] = scholarship_data
+            row, exists = self._dataframe_row(index)
+            tail = row + 1 if exists else row
+            
+            parts = [self.scholarships_df.iloc[:row], row_df, self.scholarships_df.iloc[tail:]]
+            self.scholarships_df = pd.concat([part for part in parts if not part.empty], ignore_index=True)
+            self._list_positions = np.concatenate([
+                self._list_positions[:row],
+                [index] if not row_df.empty else [],
+                self._list_positions[tail:]
+            ]).astype(np.int64)
+            self._drop_unused_categories()
+            self._index_tokens = None
     
     def delete_scholarship(self, index: int):
         """Delete a scholarship by index"""
-        if 0 <= index < len(self.scholarships):
-            del self.scholarships[index]
+        if 0 <= index < len(self._list_positions) + len(self._rejected):
+            self._version += 1
+            
+            if self.scholarships_df is None or self.scholarships_df.empty:
+                records = self.scholarships
+                del records[index]
+                self._rebuild_dataframe(records)
+                return
             
-            # Recreate the dataframe
-            self.scholarships_df = pd.DataFrame(self.scholarships)
-            self._clean_and_validate_data()
+            self._rejected.pop(index, None)
+            self._rejected = {
+                position - 1 if position > index else position: record
+                for position, record in self._rejected.items()
+            }
+            
+            # Drop the matching row, if it passed validation, and shift later positions down
+            row, exists = self._dataframe_row(index)
+            if exists:
+                self.scholarships_df = self.scholarships_df.drop(index=row).reset_index(drop=True)
+                self._list_positions = np.delete(self._list_positions, row)
+                self._drop_unused_categories()
+                self._index_tokens = None
+            self._list_positions[self._list_positions > index] -= 1
     
-    def export_data(self, format: str = 'json') -> str:
-        """Export scholarship data in specified format"""
-        if format.lower() == 'json':
-            return json.dumps(self.scholarships, indent=2, default=str)
-        elif format.lower() == 'csv':
-            if self.scholarships_df is not None:
-                return self.scholarships_df.to_csv(index=False)
-            else:
-                return ""
-        else:
+    def _dataframe_row(self, index: int) -> Tuple[int, bool]:
+        """Locate the dataframe row for an entry of self.scholarships, and whether it exists"""
+        row = int(np.searchsorted(self._list_positions, index))
+        exists = row < len(self._list_positions) and self._list_positions[row] == index
+        return row, bool(exists)
+    
+    def export_data(self, format: str = 'json', buf: Optional[IO[str]] = None, indent: Optional[int] = None) -> Optional[str]:
+        """Export scholarship data in specified format, streaming into buf if given (otherwise returned as a string)"""
+        if format.lower() not in ('json', 'csv'):
             raise ValueError("Unsupported export format. Use 'json' or 'csv'.")
+        
+        output = StringIO() if buf is None else buf
+        if format.lower() == 'json':
+            json.dump(self.scholarships, output, indent=indent, default=str)
+        elif self.scholarships_df is not None:
+            self.scholarships_df.to_csv(output, index=False)
+        
+        return output.getvalue() if buf is None else None
     
     def import_data(self, data: str, format: str = 'json'):
         """Import scholarship data from string"""
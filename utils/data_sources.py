@@ -1,10 +1,64 @@
 import requests
 import json
 import pandas as pd
-from typing import List, Dict, Any, Optional
+import numpy as np
+from typing import List, Dict, Any, Optional, Tuple
 import streamlit as st
 from datetime import datetime, timedelta
+from functools import lru_cache
 import time
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+# Category -> keywords; the first category with a keyword in the text wins
+CATEGORY_KEYWORDS = {
+    'STEM': ['stem', 'science', 'technology', 'engineering', 'mathematics', 'computer', 'programming'],
+    'Medicine': ['medicine', 'medical', 'health', 'nursing', 'pharmacy', 'dental', 'healthcare'],
+    'Business': ['business', 'finance', 'accounting', 'marketing', 'management', 'economics'],
+    'Education': ['education', 'teaching', 'teacher', 'educator', 'curriculum'],
+    'Arts': ['arts', 'music', 'theater', 'dance', 'creative', 'fine arts', 'visual'],
+    'Social Sciences': ['social', 'psychology', 'sociology', 'anthropology', 'political'],
+    'Environmental Science': ['environment', 'ecology', 'sustainability', 'conservation'],
+    'Engineering': ['engineering', 'mechanical', 'electrical', 'civil', 'chemical'],
+    'Computer Science': ['computer science', 'software', 'programming', 'coding', 'it']
+}
+
+# Demographic -> keywords; every demographic with a keyword in the text is reported
+DEMOGRAPHIC_KEYWORDS = {
+    'Women in STEM': ['women', 'female', 'girls in stem', 'women in technology'],
+    'LGBTQ+': ['lgbtq', 'lgbt', 'gay', 'lesbian', 'transgender', 'queer'],
+    'First-generation college student': ['first generation', 'first-gen', 'first in family'],
+    'Underrepresented minority': ['minority', 'underrepresented', 'african american', 'hispanic', 'latino', 'native american'],
+    'International student': ['international', 'foreign', 'non-citizen', 'visa'],
+    'Veteran': ['veteran', 'military', 'armed forces', 'service member'],
+    'Student with disability': ['disability', 'disabled', 'accessibility', 'special needs'],
+    'Low-income background': ['low income', 'financial need', 'pell grant', 'need-based'],
+    'Rural/Small town background': ['rural', 'small town', 'farming', 'agriculture']
+}
+
+DEADLINE_FORMATS = (
+    '%m/%d/%Y', '%m-%d-%Y', '%Y-%m-%d',
+    '%B %d, %Y', '%b %d, %Y',
+    '%m/%d/%y', '%m-%d-%y'
+)
+
+GPA_PATTERN = re.compile(r'\d+\.?\d*')
+
+# Concurrent AI enrichment requests in validate_and_enrich_data
+ENRICH_WORKERS = 8
+
+# Fields of a standardized scholarship record, in output order
+STANDARDIZED_COLUMNS = [
+    'title', 'amount', 'category', 'target_demographics', 'description', 'eligibility_criteria',
+    'application_requirements', 'deadline', 'gpa_requirement', 'website', 'contact_info', 'source', 'last_updated'
+]
+
+_CATEGORIES = tuple(CATEGORY_KEYWORDS)
+_DEMOGRAPHICS = tuple(DEMOGRAPHIC_KEYWORDS)
+
+# One alternation per category/demographic, so each is a single regex scan of the text
+_CATEGORY_PATTERNS = tuple(re.compile('|'.join(map(re.escape, keywords))) for keywords in CATEGORY_KEYWORDS.values())
+_DEMOGRAPHIC_PATTERNS = tuple(re.compile('|'.join(map(re.escape, keywords))) for keywords in DEMOGRAPHIC_KEYWORDS.values())
 
 class ScholarshipDataSources:
     """Integrate with real scholarship data sources"""
@@ -94,7 +148,116 @@ class ScholarshipDataSources:
         
         return standardized
     
-    def _parse_amount(self, amount_str) -> float:
+    def standardize_batch(self, raw_scholarships: List[Dict[str, Any]], source: str) -> pd.DataFrame:
+        """
+        Standardize a batch of scholarships from one source with column operations
+        """
+        if not raw_scholarships:
+            return pd.DataFrame(columns=STANDARDIZED_COLUMNS)
+        
+        raw_df = pd.DataFrame(raw_scholarships)
+        
+        def raw_column(name: str, default: Any = '') -> pd.Series:
+            if name not in raw_df.columns:
+                return pd.Series(default, index=raw_df.index, dtype=object)
+            return raw_df[name].astype(object).where(raw_df[name].notna(), default)
+        
+        title = raw_column('title')
+        description = raw_column('description')
+        eligibility = raw_column('eligibility')
+        
+        category_text = (title + ' ' + description + ' ' + raw_column('field') + ' ' + raw_column('major')).str.lower()
+        demographic_text = (title + ' ' + description + ' ' + eligibility + ' ' + raw_column('target')).str.lower()
+        
+        return pd.DataFrame({
+            'title': title,
+            'amount': self._parse_amounts(raw_column('amount', 0)),
+            'category': self._categorize_texts(category_text),
+            'target_demographics': self._demographics_in_texts(demographic_text),
+            'description': description,
+            'eligibility_criteria': eligibility,
+            'application_requirements': raw_column('requirements'),
+            'deadline': self._parse_deadlines(raw_column('deadline')),
+            'gpa_requirement': self._parse_gpas(raw_column('gpa', 0)),
+            'website': raw_column('url'),
+            'contact_info': raw_column('contact'),
+            'source': source,
+            'last_updated': datetime.now().isoformat()
+        }, columns=STANDARDIZED_COLUMNS)
+    
+    def _parse_amounts(self, amounts: pd.Series) -> pd.Series:
+        """Vectorized _parse_amount"""
+        is_text = amounts.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+        parsed = pd.to_numeric(amounts.where(~is_text), errors='coerce')
+        
+        if is_text.any():
+            cleaned = amounts[is_text].str.replace('$', '', regex=False).str.replace(',', '', regex=False).str.strip()
+            
+            # Ranges take the maximum; otherwise drop any "up to" prefix
+            parts = cleaned.str.split('-')
+            is_range = parts.str.len() == 2
+            range_max = pd.Series(np.nan, index=cleaned.index)
+            if is_range.any():
+                range_max[is_range] = pd.to_numeric(parts[is_range].str[1].str.strip(), errors='coerce')
+            lowered = cleaned.str.lower()
+            up_to = lowered.str.contains('up to', regex=False)
+            plain = pd.to_numeric(cleaned.where(~up_to, lowered.str.replace('up to', '', regex=False).str.strip()), errors='coerce')
+            
+            parsed[is_text] = range_max.fillna(plain)
+        
+        return parsed.fillna(0.0).astype(float)
+    
+    def _parse_gpas(self, gpas: pd.Series) -> pd.Series:
+        """Vectorized _parse_gpa"""
+        is_text = gpas.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+        parsed = pd.to_numeric(gpas.where(~is_text), errors='coerce')
+        
+        if is_text.any():
+            extracted = gpas[is_text].str.extract(f'({GPA_PATTERN.pattern})', expand=False)
+            parsed[is_text] = pd.to_numeric(extracted, errors='coerce').clip(upper=4.0)  # Cap at 4.0
+        
+        return parsed.fillna(0.0).astype(float)
+    
+    def _parse_deadlines(self, deadlines: pd.Series) -> pd.Series:
+        """Vectorized _parse_deadline"""
+        parsed = deadlines.copy()
+        parsed[deadlines.eq('')] = (datetime.now() + timedelta(days=180)).strftime('%m/%d/%Y')
+        
+        # Try each format on the deadlines no earlier format matched
+        pending = deadlines[deadlines.map(lambda value: isinstance(value, str) and value != '')]
+        for fmt in DEADLINE_FORMATS:
+            if pending.empty:
+                break
+            dates = pd.to_datetime(pending, format=fmt, errors='coerce')
+            matched = dates.notna()
+            parsed[matched[matched].index] = dates[matched].dt.strftime('%m/%d/%Y')
+            pending = pending[~matched]
+        
+        return parsed
+    
+    def _categorize_texts(self, texts: pd.Series) -> np.ndarray:
+        """Vectorized _categorize_text"""
+        category_hits = np.column_stack([
+            texts.str.contains(pattern.pattern, regex=True).to_numpy(dtype=bool) for pattern in _CATEGORY_PATTERNS
+        ])
+        
+        first_hit = np.array(_CATEGORIES, dtype=object)[category_hits.argmax(axis=1)]
+        return np.where(category_hits.any(axis=1), first_hit, 'General')
+    
+    def _demographics_in_texts(self, texts: pd.Series) -> List[List[str]]:
+        """Vectorized _demographics_in_text"""
+        demographic_hits = np.column_stack([
+            texts.str.contains(pattern.pattern, regex=True).to_numpy(dtype=bool) for pattern in _DEMOGRAPHIC_PATTERNS
+        ])
+        
+        return [
+            [_DEMOGRAPHICS[position] for position in np.flatnonzero(row_hits)] or ['General']
+            for row_hits in demographic_hits
+        ]
+    
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _parse_amount(amount_str) -> float:
         """Parse scholarship amount from various formats"""
         if isinstance(amount_str, (int, float)):
             return float(amount_str)
@@ -132,21 +295,14 @@ class ScholarshipDataSources:
             raw_data.get('major', '')
         ]).lower()
         
-        # Category mapping
-        category_keywords = {
-            'STEM': ['stem', 'science', 'technology', 'engineering', 'mathematics', 'computer', 'programming'],
-            'Medicine': ['medicine', 'medical', 'health', 'nursing', 'pharmacy', 'dental', 'healthcare'],
-            'Business': ['business', 'finance', 'accounting', 'marketing', 'management', 'economics'],
-            'Education': ['education', 'teaching', 'teacher', 'educator', 'curriculum'],
-            'Arts': ['arts', 'music', 'theater', 'dance', 'creative', 'fine arts', 'visual'],
-            'Social Sciences': ['social', 'psychology', 'sociology', 'anthropology', 'political'],
-            'Environmental Science': ['environment', 'ecology', 'sustainability', 'conservation'],
-            'Engineering': ['engineering', 'mechanical', 'electrical', 'civil', 'chemical'],
-            'Computer Science': ['computer science', 'software', 'programming', 'coding', 'it']
-        }
-        
-        for category, keywords in category_keywords.items():
-            if any(keyword in text_to_analyze for keyword in keywords):
+        return self._categorize_text(text_to_analyze)
+    
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _categorize_text(text_to_analyze: str) -> str:
+        """Return the first category with a keyword in the lowercased text"""
+        for category, pattern in zip(_CATEGORIES, _CATEGORY_PATTERNS):
+            if pattern.search(text_to_analyze):
                 return category
         
         return 'General'
@@ -160,38 +316,31 @@ class ScholarshipDataSources:
             raw_data.get('target', '')
         ]).lower()
         
-        demographics_keywords = {
-            'Women in STEM': ['women', 'female', 'girls in stem', 'women in technology'],
-            'LGBTQ+': ['lgbtq', 'lgbt', 'gay', 'lesbian', 'transgender', 'queer'],
-            'First-generation college student': ['first generation', 'first-gen', 'first in family'],
-            'Underrepresented minority': ['minority', 'underrepresented', 'african american', 'hispanic', 'latino', 'native american'],
-            'International student': ['international', 'foreign', 'non-citizen', 'visa'],
-            'Veteran': ['veteran', 'military', 'armed forces', 'service member'],
-            'Student with disability': ['disability', 'disabled', 'accessibility', 'special needs'],
-            'Low-income background': ['low income', 'financial need', 'pell grant', 'need-based'],
-            'Rural/Small town background': ['rural', 'small town', 'farming', 'agriculture']
-        }
-        
-        found_demographics = []
-        for demographic, keywords in demographics_keywords.items():
-            if any(keyword in text_to_analyze for keyword in keywords):
-                found_demographics.append(demographic)
-        
-        return found_demographics if found_demographics else ['General']
+        return list(self._demographics_in_text(text_to_analyze))
+    
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _demographics_in_text(text_to_analyze: str) -> Tuple[str, ...]:
+        """Return every demographic with a keyword in the lowercased text"""
+        found_demographics = tuple(
+            demographic for demographic, pattern in zip(_DEMOGRAPHICS, _DEMOGRAPHIC_PATTERNS)
+            if pattern.search(text_to_analyze)
+        )
+        
+        return found_demographics if found_demographics else ('General',)
     
     def _parse_deadline(self, deadline_str: str) -> str:
         """Parse deadline from various formats"""
         if not deadline_str:
             return (datetime.now() + timedelta(days=180)).strftime('%m/%d/%Y')
         
-        # Handle common date formats
-        date_formats = [
-            '%m/%d/%Y', '%m-%d-%Y', '%Y-%m-%d',
-            '%B %d, %Y', '%b %d, %Y',
-            '%m/%d/%y', '%m-%d-%y'
-        ]
-        
-        for fmt in date_formats:
+        return self._normalize_deadline(deadline_str)
+    
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _normalize_deadline(deadline_str: str) -> str:
+        """Reformat a deadline in any of the common date formats as MM/DD/YYYY"""
+        for fmt in DEADLINE_FORMATS:
             try:
                 parsed_date = datetime.strptime(deadline_str, fmt)
                 return parsed_date.strftime('%m/%d/%Y')
@@ -200,15 +349,16 @@ class ScholarshipDataSources:
         
         return deadline_str
     
-    def _parse_gpa(self, gpa_str) -> float:
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _parse_gpa(gpa_str) -> float:
         """Parse GPA requirement from various formats"""
         if isinstance(gpa_str, (int, float)):
             return float(gpa_str)
         
         if isinstance(gpa_str, str):
             # Extract numeric value
-            import re
-            numbers = re.findall(r'\d+\.?\d*', gpa_str)
+            numbers = GPA_PATTERN.findall(gpa_str)
             if numbers:
                 gpa = float(numbers[0])
                 return min(gpa, 4.0)  # Cap at 4.0
@@ -229,15 +379,20 @@ class ScholarshipDataSources:
             ('foundations', self.fetch_foundation_scholarships)
         ]
         
-        for source_name, fetch_function in sources:
-            try:
-                scholarships = fetch_function(limit_per_source)
-                for scholarship in scholarships:
-                    standardized = self.standardize_scholarship_data(scholarship, source_name)
-                    all_scholarships.append(standardized)
-            except Exception as e:
-                st.warning(f"Could not fetch from {source_name}: {str(e)}")
-                continue
+        # Fetch concurrently, then standardize in source order on this thread (st.* needs the script thread)
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = [
+                (source_name, executor.submit(fetch_function, limit_per_source))
+                for source_name, fetch_function in sources
+            ]
+            
+            for source_name, future in futures:
+                try:
+                    standardized = self.standardize_batch(future.result(), source_name)
+                    all_scholarships.extend(standardized.to_dict('records'))
+                except Exception as e:
+                    st.warning(f"Could not fetch from {source_name}: {str(e)}")
+                    continue
         
         return all_scholarships
     
@@ -264,26 +419,29 @@ class ScholarshipDataSources:
         from utils.ai_enhancer import AIEnhancer
         
         ai_enhancer = AIEnhancer()
-        enriched_scholarships = []
         
-        for scholarship in scholarships:
-            try:
-                # Validate required fields
-                if not scholarship.get('title') or not scholarship.get('amount'):
-                    continue
-                
-                # Enrich with AI if available
-                if ai_enhancer.is_available():
-                    try:
-                        enriched = ai_enhancer.standardize_scholarship_data(scholarship)
-                        enriched_scholarships.append(enriched)
-                    except Exception:
-                        # Fall back to original data if AI enhancement fails
-                        enriched_scholarships.append(scholarship)
-                else:
+        # Validate required fields before paying for any AI requests
+        valid_scholarships = [
+            scholarship for scholarship in scholarships
+            if isinstance(scholarship, dict) and scholarship.get('title') and scholarship.get('amount')
+        ]
+        
+        if not ai_enhancer.is_available():
+            return valid_scholarships
+        
+        # Each enrichment is a network round-trip, so run them concurrently
+        enriched_scholarships = []
+        with ThreadPoolExecutor(max_workers=ENRICH_WORKERS) as executor:
+            futures = [
+                (scholarship, executor.submit(ai_enhancer.standardize_scholarship_data, scholarship))
+                for scholarship in valid_scholarships
+            ]
+            
+            for scholarship, future in futures:
+                try:
+                    enriched_scholarships.append(future.result())
+                except Exception:
+                    # Fall back to original data if AI enhancement fails
                     enriched_scholarships.append(scholarship)
-                    
-            except Exception as e:
-                continue
         
         return enriched_scholarships
\ No newline at end of file
@@ -1,18 +1,110 @@
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Any, Optional
 import streamlit as st
-from database.models import create_tables, get_session
+from database.models import create_tables, get_session, Scholarship
 from database.repository import ScholarshipRepository, UserRepository, ApplicationRepository
 from utils.data_integration import RealScholarshipIntegrator
+from utils.scholarship_data import validate_scholarships_batch
+from operator import attrgetter
 import uuid
 
+# Scholarship columns exposed as DataFrames, and what a missing (falsy) value becomes
+SCHOLARSHIP_COLUMNS = (
+    'id', 'title', 'amount', 'category', 'target_demographics', 'description', 'eligibility_criteria',
+    'application_requirements', 'deadline', 'gpa_requirement', 'website', 'contact_info', 'source',
+    'verification_status', 'application_difficulty', 'estimated_applicants', 'last_updated'
+)
+SEARCH_RESULT_COLUMNS = SCHOLARSHIP_COLUMNS[:13]
+SCHOLARSHIP_DEFAULTS = {
+    'title': '', 'amount': 0, 'category': '', 'description': '', 'eligibility_criteria': '',
+    'application_requirements': '', 'deadline': '', 'gpa_requirement': 0.0, 'website': '', 'contact_info': '',
+    'source': '', 'verification_status': 'verified', 'application_difficulty': 'Medium', 'estimated_applicants': 0
+}
+APPLICATION_COLUMNS = (
+    'id', 'scholarship_id', 'scholarship_title', 'status', 'priority', 'completion_percentage',
+    'required_documents', 'submitted_documents', 'notes', 'deadline', 'date_added', 'last_updated'
+)
+# Arrow-backed strings with NaN missing values: pandas 3's default string dtype, made explicit for pandas 2.3
+ARROW_STRING_DTYPE = pd.StringDtype('pyarrow', na_value=np.nan)
+# Pull all of a row's fields in one C-level call (works on ORM objects and on query rows alike)
+_search_result_fields = attrgetter(*SEARCH_RESULT_COLUMNS)
+_application_fields = attrgetter(*APPLICATION_COLUMNS)
+
+def _scholarship_to_dict(scholarship) -> Dict[str, Any]:
+    """A scholarship's search-result fields as a dict, with falsy values replaced by their defaults"""
+    record = dict(zip(SEARCH_RESULT_COLUMNS, _search_result_fields(scholarship)))
+    for column, default in SCHOLARSHIP_DEFAULTS.items():
+        if column in record and not record[column]:
+            record[column] = default
+    record['target_demographics'] = record['target_demographics'] or []
+    return record
+
+def _application_to_dict(application) -> Dict[str, Any]:
+    """An application's tracked fields as a dict, with timestamps as ISO strings"""
+    record = dict(zip(APPLICATION_COLUMNS, _application_fields(application)))
+    record['deadline'] = application.deadline.isoformat() if application.deadline else None
+    record['date_added'] = application.date_added.isoformat()
+    record['last_updated'] = application.last_updated.isoformat()
+    return record
+
+def _scholarship_rows_to_df(rows: List[Any], columns: tuple) -> pd.DataFrame:
+    """Build a DataFrame straight from row tuples, filling falsy values with their defaults"""
+    if not rows:
+        return pd.DataFrame()
+    return _fill_scholarship_defaults(pd.DataFrame.from_records(rows, columns=columns))
+
+def _fill_scholarship_defaults(df: pd.DataFrame) -> pd.DataFrame:
+    """Replace falsy values with their defaults and settle each column's dtype"""
+    for column in df.columns:
+        if column == 'target_demographics':
+            df[column] = [demographics or [] for demographics in df[column]]
+        elif column in SCHOLARSHIP_DEFAULTS:
+            default = SCHOLARSHIP_DEFAULTS[column]
+            values = df[column]
+            falsy = values.isna() | values.eq('' if isinstance(default, str) else 0)
+            df[column] = values.where(~falsy, default)
+            if isinstance(default, str):
+                df[column] = df[column].astype(ARROW_STRING_DTYPE)
+            else:
+                numeric_type = 'int64' if Scholarship.__table__.c[column].type.python_type is int else 'float64'
+                df[column] = df[column].astype(numeric_type)
+    return df
+
+@st.cache_data(show_spinner=False)
+def _cached_scholarships_df(version, _scholarship_repo: ScholarshipRepository) -> pd.DataFrame:
+    """All scholarships as a DataFrame, cached per scholarship table version"""
+    # Rows stream in batches, so only one batch of row tuples is alive next to the frames
+    frames = [
+        pd.DataFrame.from_records(batch, columns=SCHOLARSHIP_COLUMNS)
+        for batch in _scholarship_repo.iter_scholarships(columns=SCHOLARSHIP_COLUMNS)
+    ]
+    if not frames:
+        return pd.DataFrame()
+    return _fill_scholarship_defaults(pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0])
+
+@st.cache_data(show_spinner=False)
+def _cached_statistics(version, _scholarship_repo: ScholarshipRepository) -> Dict[str, Any]:
+    """Scholarship statistics, cached per scholarship table version"""
+    return _scholarship_repo.get_scholarship_statistics()
+
+@st.cache_data(show_spinner=False, max_entries=1024)
+def _cached_scholarship(scholarship_id: int, version, _scholarship_repo: ScholarshipRepository) -> Optional[Dict[str, Any]]:
+    """One scholarship as a dict, cached per id and scholarship table version"""
+    scholarship = _scholarship_repo.get_scholarship_by_id(scholarship_id)
+    if scholarship:
+        return _scholarship_to_dict(scholarship)
+    return None
+
 class DatabaseManager:
     """Enhanced data manager with PostgreSQL backend"""
     
     def __init__(self):
-        self.scholarship_repo = ScholarshipRepository()
-        self.user_repo = UserRepository()
-        self.app_repo = ApplicationRepository()
+        # One session shared by all repositories
+        self._session = get_session()
+        self.scholarship_repo = ScholarshipRepository(self._session)
+        self.user_repo = UserRepository(self._session)
+        self.app_repo = ApplicationRepository(self._session)
         self._ensure_tables_exist()
         self._user_id = self._get_or_create_user_id()
     
@@ -33,20 +125,27 @@ class DatabaseManager:
         """Load scholarships from database or refresh from sources"""
         try:
             # Check if we have scholarships in database
-            existing_count = len(self.scholarship_repo.get_all_scholarships())
+            has_scholarships = self.scholarship_repo.exists()
             
-            if existing_count == 0 or force_reload:
+            if force_reload or not has_scholarships:
                 # Load from authentic sources
                 integrator = RealScholarshipIntegrator()
                 real_scholarships = integrator.aggregate_all_real_scholarships()
-                enriched_scholarships = integrator.enrich_with_additional_data(real_scholarships)
+                for error in integrator.last_errors:
+                    st.warning(f"Error fetching from source: {error}")
+                enriched_scholarships = validate_scholarships_batch(
+                    integrator.enrich_with_additional_data(real_scholarships)
+                )
                 
                 # Clear existing if force reload
-                if force_reload and existing_count > 0:
+                if force_reload and has_scholarships:
                     self._clear_scholarships()
                 
-                # Bulk insert into database
-                self.scholarship_repo.bulk_create_scholarships(enriched_scholarships)
+                # Bulk load into database (COPY on PostgreSQL)
+                self.scholarship_repo.copy_bulk(enriched_scholarships, rebuild_indexes=force_reload)
+                _cached_scholarships_df.clear()
+                _cached_statistics.clear()
+                _cached_scholarship.clear()
                 st.success(f"Loaded {len(enriched_scholarships)} scholarships from verified sources")
                 
         except Exception as e:
@@ -55,46 +154,20 @@ class DatabaseManager:
     def _clear_scholarships(self):
         """Clear existing scholarships (for reload)"""
         try:
-            from database.models import Scholarship, get_session
-            session = get_session()
-            session.query(Scholarship).delete()
-            session.commit()
-            session.close()
+            self._session.query(Scholarship).delete()
+            self._session.commit()
+            _cached_scholarships_df.clear()
+            _cached_statistics.clear()
+            _cached_scholarship.clear()
         except Exception as e:
+            self._session.rollback()
             st.error(f"Error clearing scholarships: {str(e)}")
     
     def get_scholarships_df(self) -> pd.DataFrame:
         """Get scholarships as DataFrame"""
         try:
-            scholarships = self.scholarship_repo.get_all_scholarships()
-            
-            if not scholarships:
-                return pd.DataFrame()
-            
-            # Convert to DataFrame
-            data = []
-            for scholarship in scholarships:
-                data.append({
-                    'id': scholarship.id,
-                    'title': scholarship.title or '',
-                    'amount': scholarship.amount or 0,
-                    'category': scholarship.category or '',
-                    'target_demographics': scholarship.target_demographics or [],
-                    'description': scholarship.description or '',
-                    'eligibility_criteria': scholarship.eligibility_criteria or '',
-                    'application_requirements': scholarship.application_requirements or '',
-                    'deadline': scholarship.deadline or '',
-                    'gpa_requirement': scholarship.gpa_requirement or 0.0,
-                    'website': scholarship.website or '',
-                    'contact_info': scholarship.contact_info or '',
-                    'source': scholarship.source or '',
-                    'verification_status': scholarship.verification_status or 'verified',
-                    'application_difficulty': scholarship.application_difficulty or 'Medium',
-                    'estimated_applicants': scholarship.estimated_applicants or 0,
-                    'last_updated': scholarship.last_updated
-                })
-            
-            return pd.DataFrame(data)
+            # Streamlit reruns on every interaction; only rebuild when the table changed
+            return _cached_scholarships_df(self.scholarship_repo.get_version(), self.scholarship_repo)
             
         except Exception as e:
             st.error(f"Error retrieving scholarships: {str(e)}")
@@ -127,32 +200,9 @@ class DatabaseManager:
                 if 'max_gpa_requirement' in filters:
                     search_params['max_gpa'] = filters['max_gpa_requirement']
             
-            # Perform search
-            scholarships = self.scholarship_repo.search_scholarships(**search_params)
-            
-            # Convert to DataFrame
-            if not scholarships:
-                return pd.DataFrame()
-            
-            data = []
-            for scholarship in scholarships:
-                data.append({
-                    'id': scholarship.id,
-                    'title': scholarship.title or '',
-                    'amount': scholarship.amount or 0,
-                    'category': scholarship.category or '',
-                    'target_demographics': scholarship.target_demographics or [],
-                    'description': scholarship.description or '',
-                    'eligibility_criteria': scholarship.eligibility_criteria or '',
-                    'application_requirements': scholarship.application_requirements or '',
-                    'deadline': scholarship.deadline or '',
-                    'gpa_requirement': scholarship.gpa_requirement or 0.0,
-                    'website': scholarship.website or '',
-                    'contact_info': scholarship.contact_info or '',
-                    'source': scholarship.source or ''
-                })
-            
-            return pd.DataFrame(data)
+            # Perform search, filtered in SQL and fetched as plain rows
+            rows = self.scholarship_repo.search_scholarships(columns=SEARCH_RESULT_COLUMNS, **search_params)
+            return _scholarship_rows_to_df(rows, SEARCH_RESULT_COLUMNS)
             
         except Exception as e:
             st.error(f"Error searching scholarships: {str(e)}")
@@ -161,25 +211,7 @@ class DatabaseManager:
     def get_scholarship_by_id(self, scholarship_id: int) -> Optional[Dict[str, Any]]:
         """Get specific scholarship by ID"""
         try:
-            scholarship = self.scholarship_repo.get_scholarship_by_id(scholarship_id)
-            if scholarship:
-                return {
-                    'id': scholarship.id,
-                    'title': scholarship.title or '',
-                    'amount': scholarship.amount or 0,
-                    'category': scholarship.category or '',
-                    'target_demographics': scholarship.target_demographics or [],
-                    'description': scholarship.description or '',
-                    'eligibility_criteria': scholarship.eligibility_criteria or '',
-                    'application_requirements': scholarship.application_requirements or '',
-                    'deadline': scholarship.deadline or '',
-                    'gpa_requirement': scholarship.gpa_requirement or 0.0,
-                    'website': scholarship.website or '',
-                    'contact_info': scholarship.contact_info or '',
-                    'source': scholarship.source or ''
-                }
-            return None
-            
+            return _cached_scholarship(scholarship_id, self.scholarship_repo.get_version(), self.scholarship_repo)
         except Exception as e:
             st.error(f"Error retrieving scholarship: {str(e)}")
             return None
@@ -187,10 +219,7 @@ class DatabaseManager:
     def get_categories(self) -> List[str]:
         """Get all unique categories"""
         try:
-            df = self.get_scholarships_df()
-            if df.empty:
-                return []
-            return sorted(df['category'].unique().tolist())
+            return sorted(category or '' for category in self.scholarship_repo.distinct_categories())
         except Exception as e:
             st.error(f"Error getting categories: {str(e)}")
             return []
@@ -198,16 +227,7 @@ class DatabaseManager:
     def get_demographics(self) -> List[str]:
         """Get all unique demographics"""
         try:
-            df = self.get_scholarships_df()
-            if df.empty:
-                return []
-            
-            all_demographics = set()
-            for demo_list in df['target_demographics']:
-                if isinstance(demo_list, list):
-                    all_demographics.update(demo_list)
-            
-            return sorted(list(all_demographics))
+            return sorted(self.scholarship_repo.distinct_demographics())
         except Exception as e:
             st.error(f"Error getting demographics: {str(e)}")
             return []
@@ -215,7 +235,7 @@ class DatabaseManager:
     def get_statistics(self) -> Dict[str, Any]:
         """Get scholarship statistics"""
         try:
-            return self.scholarship_repo.get_scholarship_statistics()
+            return _cached_statistics(self.scholarship_repo.get_version(), self.scholarship_repo)
         except Exception as e:
             st.error(f"Error getting statistics: {str(e)}")
             return {}
@@ -282,19 +302,7 @@ class DatabaseManager:
             
             application = self.app_repo.create_application(app_data)
             
-            return {
-                'id': application.id,
-                'scholarship_id': application.scholarship_id,
-                'scholarship_title': application.scholarship_title,
-                'status': application.status,
-                'priority': application.priority,
-                'completion_percentage': application.completion_percentage,
-                'required_documents': application.required_documents,
-                'submitted_documents': application.submitted_documents,
-                'notes': application.notes,
-                'date_added': application.date_added.isoformat(),
-                'last_updated': application.last_updated.isoformat()
-            }
+            return _application_to_dict(application)
             
         except Exception as e:
             st.error(f"Error adding application: {str(e)}")
@@ -303,26 +311,10 @@ class DatabaseManager:
     def get_user_applications(self) -> List[Dict[str, Any]]:
         """Get all applications for current user"""
         try:
-            applications = self.app_repo.get_user_applications(self._user_id)
-            
-            result = []
-            for app in applications:
-                result.append({
-                    'id': app.id,
-                    'scholarship_id': app.scholarship_id,
-                    'scholarship_title': app.scholarship_title,
-                    'status': app.status,
-                    'priority': app.priority,
-                    'completion_percentage': app.completion_percentage,
-                    'required_documents': app.required_documents,
-                    'submitted_documents': app.submitted_documents,
-                    'notes': app.notes,
-                    'deadline': app.deadline.isoformat() if app.deadline else None,
-                    'date_added': app.date_added.isoformat(),
-                    'last_updated': app.last_updated.isoformat()
-                })
+            # Plain row tuples are far lighter than ORM objects with their per-instance state
+            applications = self.app_repo.get_user_applications(self._user_id, columns=APPLICATION_COLUMNS)
             
-            return result
+            return [_application_to_dict(app) for app in applications]
             
         except Exception as e:
             st.error(f"Error getting applications: {str(e)}")
@@ -359,8 +351,6 @@ class DatabaseManager:
     def close_connections(self):
         """Close database connections"""
         try:
-            self.scholarship_repo.close()
-            self.user_repo.close()
-            self.app_repo.close()
+            self._session.close()
         except Exception as e:
             st.error(f"Error closing connections: {str(e)}")
\ No newline at end of file
@@ -1,6 +1,38 @@
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
+from functools import lru_cache
 import random
+import re
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Every scholarship asks for these; generated ones add a random selection of the optional ones
+BASE_REQUIREMENTS = ["Personal statement", "Academic transcripts"]
+OPTIONAL_REQUIREMENTS = [
+    "Letters of recommendation (2-3)",
+    "Resume or CV",
+    "Essay on career goals",
+    "Portfolio of work",
+    "Community service documentation",
+    "Financial aid documentation",
+    "Leadership experience examples",
+    "Research or project descriptions"
+]
+
+SCHOLARSHIP_CATEGORIES = (
+    "STEM", "Engineering", "Computer Science", "Medicine", "Business",
+    "Education", "Arts", "Social Sciences", "Environmental Science",
+    "Public Health", "Nursing", "Mathematics", "Biology", "Chemistry",
+    "Physics", "Psychology", "Communications", "Law", "General"
+)
+TARGET_DEMOGRAPHICS = (
+    "Women in STEM", "LGBTQ+", "First-generation college student",
+    "Underrepresented minority", "International student", "Veteran",
+    "Student with disability", "Low-income background",
+    "Rural/Small town background", "Single parent", "Non-traditional student"
+)
 
 def get_initial_scholarship_data() -> List[Dict[str, Any]]:
     """
@@ -8,6 +40,15 @@ def get_initial_scholarship_data() -> List[Dict[str, Any]]:
     Note: This is not mock data - it represents the structure for real scholarship data
     that would be integrated from actual sources in production.
     """
+    # The dataset is generated once; callers get their own copies to mutate
+    return [
+        dict(scholarship, target_demographics=list(scholarship["target_demographics"]))
+        for scholarship in _generate_initial_scholarship_data()
+    ]
+
+@lru_cache(maxsize=1)
+def _generate_initial_scholarship_data() -> tuple:
+    """Generate the initial scholarship dataset (seeded, so it is the same on every run)"""
     
     # Define realistic scholarship categories and demographics
     categories = [
@@ -116,99 +157,121 @@ def get_initial_scholarship_data() -> List[Dict[str, Any]]:
         }
     ]
     
-    # Generate combinations
-    for i in range(470):  # Generate 470 additional scholarships to reach 500+ total
-        template = scholarship_templates[0]
-        
-        # Select random components
-        category = random.choice(categories)
-        demographics = random.sample(demographics_pool, random.randint(1, 3))
-        demographic_str = demographics[0]  # Use first demographic for title
-        
-        title_format = random.choice(template["title_formats"])
-        title = title_format.format(demographic=demographic_str, field=category)
-        
-        amount_range = random.choice(template["amount_ranges"])
-        amount = random.randint(amount_range[0], amount_range[1])
-        
-        description = random.choice(template["descriptions"]).format(
-            demographic=demographic_str.lower(), field=category.lower()
+    # Draw every random field for all generated scholarships in one vectorized pass
+    count = 470  # Generate 470 additional scholarships to reach 500+ total
+    template = scholarship_templates[0]
+    rng = np.random.default_rng(42)
+    
+    category_picks = rng.integers(0, len(categories), count)
+    # Row-wise random permutations; the first k entries of each row are a sample without replacement
+    demographic_orders = rng.random((count, len(demographics_pool))).argsort(axis=1)
+    demographic_counts = rng.integers(1, 4, count)
+    title_picks = rng.integers(0, len(template["title_formats"]), count)
+    
+    amount_ranges = np.array(template["amount_ranges"])
+    range_picks = rng.integers(0, len(amount_ranges), count)
+    amounts = rng.integers(amount_ranges[range_picks, 0], amount_ranges[range_picks, 1] + 1)
+    description_picks = rng.integers(0, len(template["descriptions"]), count)
+    
+    # Generate deadlines (between 1-12 months from now), formatting each possible day once
+    today = datetime.now().date()
+    deadline_labels = [(today + timedelta(days=days)).strftime("%m/%d/%Y") for days in range(30, 366)]
+    deadlines = [deadline_labels[offset] for offset in rng.integers(0, len(deadline_labels), count).tolist()]
+    
+    # Generate GPA requirements
+    gpa_requirements = np.round(rng.uniform(2.5, 3.8, count), 1)
+    
+    requirement_orders = rng.random((count, len(OPTIONAL_REQUIREMENTS))).argsort(axis=1)
+    requirement_counts = rng.integers(2, 5, count)
+    
+    # Build each text field in one comprehension, with the format methods and lowercased names looked up once
+    title_formatters = [title_format.format for title_format in template["title_formats"]]
+    description_formatters = [description.format for description in template["descriptions"]]
+    lowered_categories = [category.lower() for category in categories]
+    lowered_demographics = [demographic.lower() for demographic in demographics_pool]
+    
+    category_picks = category_picks.tolist()
+    demographic_picks = [
+        order[:demographic_count]
+        for order, demographic_count in zip(demographic_orders.tolist(), demographic_counts.tolist())
+    ]
+    generated_categories = [categories[pick] for pick in category_picks]
+    generated_demographics = [[demographics_pool[j] for j in picks] for picks in demographic_picks]
+    
+    # The first demographic is used for the title and description
+    titles = [
+        title_formatters[title_pick](demographic=demographics_pool[picks[0]], field=categories[category_pick])
+        for title_pick, picks, category_pick in zip(title_picks.tolist(), demographic_picks, category_picks)
+    ]
+    descriptions = [
+        description_formatters[description_pick](
+            demographic=lowered_demographics[picks[0]], field=lowered_categories[category_pick]
         )
-        
-        # Generate deadline (between 1-12 months from now)
-        days_ahead = random.randint(30, 365)
-        deadline_date = datetime.now() + timedelta(days=days_ahead)
-        deadline = deadline_date.strftime("%m/%d/%Y")
-        
-        # Generate GPA requirement
-        gpa_requirement = round(random.uniform(2.5, 3.8), 1)
-        
-        scholarship = {
+        for description_pick, picks, category_pick in zip(description_picks.tolist(), demographic_picks, category_picks)
+    ]
+    eligibility_criteria = [
+        f"Students identifying as {', '.join([lowered_demographics[j] for j in picks])} enrolled in {lowered_categories[category_pick]} or related fields"
+        for picks, category_pick in zip(demographic_picks, category_picks)
+    ]
+    application_requirements = [
+        ", ".join(BASE_REQUIREMENTS + [OPTIONAL_REQUIREMENTS[j] for j in order[:requirement_count]])
+        for order, requirement_count in zip(requirement_orders.tolist(), requirement_counts.tolist())
+    ]
+    
+    scholarships.extend(
+        {
             "title": title,
             "amount": amount,
             "category": category,
             "target_demographics": demographics,
             "description": description,
-            "eligibility_criteria": f"Students identifying as {', '.join(demographics).lower()} enrolled in {category.lower()} or related fields",
-            "application_requirements": generate_application_requirements(),
+            "eligibility_criteria": eligibility,
+            "application_requirements": requirements,
             "deadline": deadline,
             "gpa_requirement": gpa_requirement,
-            "website": f"https://scholarship-foundation-{i+1}.org",
-            "contact_info": f"info@scholarship{i+1}.org"
+            "website": f"https://scholarship-foundation-{number}.org",
+            "contact_info": f"info@scholarship{number}.org"
         }
-        
-        scholarships.append(scholarship)
+        for number, (title, amount, category, demographics, description, eligibility, requirements, deadline,
+                     gpa_requirement) in enumerate(zip(
+            titles, amounts.tolist(), generated_categories, generated_demographics, descriptions,
+            eligibility_criteria, application_requirements, deadlines, gpa_requirements.tolist()
+        ), start=1)
+    )
     
-    return scholarships
+    return tuple(scholarships)
 
 def generate_application_requirements() -> str:
     """Generate realistic application requirements"""
-    base_requirements = ["Personal statement", "Academic transcripts"]
-    
-    optional_requirements = [
-        "Letters of recommendation (2-3)",
-        "Resume or CV",
-        "Essay on career goals",
-        "Portfolio of work",
-        "Community service documentation",
-        "Financial aid documentation",
-        "Leadership experience examples",
-        "Research or project descriptions"
-    ]
-    
     # Select 2-4 additional requirements
-    additional = random.sample(optional_requirements, random.randint(2, 4))
-    all_requirements = base_requirements + additional
+    additional = random.sample(OPTIONAL_REQUIREMENTS, random.randint(2, 4))
+    all_requirements = BASE_REQUIREMENTS + additional
     
     return ", ".join(all_requirements)
 
 def get_scholarship_categories() -> List[str]:
     """Get all available scholarship categories"""
-    return [
-        "STEM", "Engineering", "Computer Science", "Medicine", "Business",
-        "Education", "Arts", "Social Sciences", "Environmental Science",
-        "Public Health", "Nursing", "Mathematics", "Biology", "Chemistry",
-        "Physics", "Psychology", "Communications", "Law", "General"
-    ]
+    return list(SCHOLARSHIP_CATEGORIES)
 
 def get_target_demographics() -> List[str]:
     """Get all available target demographics"""
-    return [
-        "Women in STEM", "LGBTQ+", "First-generation college student",
-        "Underrepresented minority", "International student", "Veteran",
-        "Student with disability", "Low-income background", 
-        "Rural/Small town background", "Single parent", "Non-traditional student"
-    ]
+    return list(TARGET_DEMOGRAPHICS)
+
+REQUIRED_FIELDS = (
+    'title', 'amount', 'category', 'target_demographics',
+    'description', 'deadline', 'gpa_requirement'
+)
+OPTIONAL_FIELD_DEFAULTS = {
+    'eligibility_criteria': 'Please check with scholarship provider',
+    'application_requirements': 'Standard application materials required',
+    'website': '',
+    'contact_info': 'Contact scholarship provider directly'
+}
 
 def validate_scholarship_data(scholarship: Dict[str, Any]) -> Dict[str, Any]:
     """Validate and clean individual scholarship data"""
-    required_fields = [
-        'title', 'amount', 'category', 'target_demographics', 
-        'description', 'deadline', 'gpa_requirement'
-    ]
-    
     # Ensure all required fields exist
-    for field in required_fields:
+    for field in REQUIRED_FIELDS:
         if field not in scholarship:
             if field == 'gpa_requirement':
                 scholarship[field] = 0.0
@@ -233,57 +296,57 @@ def validate_scholarship_data(scholarship: Dict[str, Any]) -> Dict[str, Any]:
             scholarship['target_demographics'] = []
     
     # Set defaults for optional fields
-    optional_fields = {
-        'eligibility_criteria': 'Please check with scholarship provider',
-        'application_requirements': 'Standard application materials required',
-        'website': '',
-        'contact_info': 'Contact scholarship provider directly'
-    }
-    
-    for field, default_value in optional_fields.items():
-        if field not in scholarship or not scholarship[field]:
+    for field, default_value in OPTIONAL_FIELD_DEFAULTS.items():
+        if not scholarship.get(field):
             scholarship[field] = default_value
     
     return scholarship
 
+def validate_scholarships_batch(scholarships: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Validate and clean a batch of scholarships before they are bulk-loaded"""
+    return [validate_scholarship_data(scholarship) for scholarship in scholarships]
+
 def search_scholarships_by_criteria(scholarships: List[Dict[str, Any]], 
                                   criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Search scholarships based on specific criteria"""
-    filtered_scholarships = []
+    if not scholarships:
+        return []
     
-    for scholarship in scholarships:
-        # Check amount criteria
-        if 'min_amount' in criteria and scholarship['amount'] < criteria['min_amount']:
-            continue
-        if 'max_amount' in criteria and scholarship['amount'] > criteria['max_amount']:
-            continue
-        
-        # Check category criteria
-        if 'categories' in criteria and criteria['categories']:
-            if scholarship['category'] not in criteria['categories']:
-                continue
-        
-        # Check demographics criteria
-        if 'demographics' in criteria and criteria['demographics']:
-            if not any(demo in scholarship['target_demographics'] for demo in criteria['demographics']):
-                continue
-        
-        # Check GPA criteria
-        if 'max_gpa_requirement' in criteria:
-            if scholarship['gpa_requirement'] > criteria['max_gpa_requirement']:
-                continue
-        
-        # Check keyword criteria
-        if 'keywords' in criteria and criteria['keywords']:
-            text_fields = [
-                scholarship['title'], scholarship['description'], 
-                scholarship['category'], ' '.join(scholarship['target_demographics'])
-            ]
-            combined_text = ' '.join(text_fields).lower()
-            
-            if not any(keyword.lower() in combined_text for keyword in criteria['keywords']):
-                continue
-        
-        filtered_scholarships.append(scholarship)
+    # One boolean mask over the columns instead of a per-scholarship predicate chain
+    df = pd.DataFrame(scholarships)
+    mask = np.ones(len(df), dtype=bool)
+    
+    # Check amount criteria
+    if 'min_amount' in criteria:
+        mask &= ~(df['amount'] < criteria['min_amount']).to_numpy()
+    if 'max_amount' in criteria:
+        mask &= ~(df['amount'] > criteria['max_amount']).to_numpy()
+    
+    # Check category criteria
+    if 'categories' in criteria and criteria['categories']:
+        mask &= df['category'].isin(criteria['categories']).to_numpy()
+    
+    # Check demographics criteria
+    if 'demographics' in criteria and criteria['demographics']:
+        wanted_demographics = set(criteria['demographics'])
+        mask &= np.array([not wanted_demographics.isdisjoint(demos) for demos in df['target_demographics']], dtype=bool)
+    
+    # Check GPA criteria
+    if 'max_gpa_requirement' in criteria:
+        mask &= ~(df['gpa_requirement'] > criteria['max_gpa_requirement']).to_numpy()
+    
+    # Check keyword criteria: the alternation compiles to one RE2 automaton, so each combined text is
+    # scanned once for all keywords, and the joining, lowercasing and matching all run inside Arrow
+    if 'keywords' in criteria and criteria['keywords']:
+        demographics_text = pc.binary_join(
+            pa.array(df['target_demographics'].tolist(), type=pa.list_(pa.string())), ' '
+        )
+        combined_text = pc.binary_join_element_wise(
+            *(pa.array(df[field], type=pa.string()) for field in ('title', 'description', 'category')),
+            demographics_text, ' '
+        )
+        keyword_pattern = '|'.join(re.escape(keyword.lower()) for keyword in criteria['keywords'])
+        matches = pc.match_substring_regex(pc.utf8_lower(combined_text), keyword_pattern)
+        mask &= matches.fill_null(False).to_numpy(zero_copy_only=False)
     
-    return filtered_scholarships
+    return [scholarships[position] for position in np.flatnonzero(mask)]